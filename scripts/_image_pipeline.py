@@ -0,0 +1,238 @@
+"""
+Shared pipeline behind the image uncompress/upload scripts.
+
+Lists the .jpg files in a folder, optionally re-encodes them at 100% quality
+across all cores, then writes the results to a folder and/or uploads them to
+S3 (s3://vibecheck-nyc-images/images/).
+
+Re-encoding at 100% does not bring back detail lost at 70%; it only makes the
+files larger. Images already at 100% are passed through unchanged.
+"""
+import io
+import os
+import shutil
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+
+from PIL import Image
+from tqdm import tqdm
+
+S3_BUCKET = "vibecheck-nyc-images"
+S3_PREFIX = "images/"
+
+# Anything smaller can't be a real photo (zero-byte or truncated download)
+MIN_IMAGE_BYTES = 256
+
+# Concurrent uploads
+MAX_WORKERS = 32
+
+# Images allowed to wait for encoding or uploading at once (bounds memory)
+MAX_IN_FLIGHT = 64
+
+EXTRA_ARGS = {
+    'ContentType': 'image/jpeg',
+    'ACL': 'public-read'
+}
+
+def make_s3_client():
+    """S3 client with keep-alive connections, a pool big enough for every
+    worker, and adaptive retries that back off when S3 throttles, plus the
+    transfer config for upload_image.
+
+    boto3 is imported here so the local-only scripts don't need it.
+    """
+    import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config
+
+    s3 = boto3.client('s3', config=Config(
+        max_pool_connections=64,
+        tcp_keepalive=True,
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+    ))
+    # Small JPEGs go up in one PUT on the calling worker thread
+    return s3, TransferConfig(use_threads=False)
+
+def list_images(folder):
+    """DirEntry for every .jpg file in folder.
+
+    Dotfiles are skipped, unlike the Path.glob("*.jpg") this replaced: they
+    are macOS "._*" AppleDouble metadata files, not images.
+    """
+    with os.scandir(folder) as entries:
+        return [e for e in entries if e.name.endswith(".jpg") and not e.name.startswith(".") and e.is_file()]
+
+def list_existing_objects(s3):
+    """Map key -> size for every object already under S3_PREFIX."""
+    paginator = s3.get_paginator('list_objects_v2')
+    return {
+        obj['Key']: obj['Size']
+        for page in paginator.paginate(Bucket=S3_BUCKET, Prefix=S3_PREFIX)
+        for obj in page.get('Contents', [])
+    }
+
+def bounded_map(pool, fn, items, window):
+    """Like pool.map(fn, items), but with at most `window` calls submitted ahead."""
+    pending = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def is_max_quality(img):
+    """True if every JPEG quantization step is 1, i.e. the file is already 100% quality."""
+    tables = getattr(img, 'quantization', None)
+    return bool(tables) and max(max(table) for table in tables.values()) <= 1
+
+def process_image(path_str, reencode, dst, return_data):
+    """Re-encode (or pass through) one image, write it into dst and/or return
+    its bytes. Returns (jpeg_bytes or None, error message or None)."""
+    try:
+        data = None
+        if reencode:
+            # Open image (reads only the header)
+            img = Image.open(path_str)
+
+            # Already 100%: keep the original, re-encoding would only lose detail
+            if is_max_quality(img):
+                img.close()
+            else:
+                buf = io.BytesIO()
+                img.save(buf, 'JPEG', quality=100, optimize=False)
+                data = buf.getvalue()
+
+        if dst is not None:
+            output_path = os.path.join(dst, os.path.basename(path_str))
+            if data is not None:
+                with open(output_path, 'wb') as f:
+                    f.write(data)
+            elif output_path != path_str:
+                shutil.copyfile(path_str, output_path)
+
+        if return_data and data is None:
+            with open(path_str, 'rb') as f:
+                data = f.read()
+        return (data if return_data else None), None
+
+    except Exception as e:
+        return None, str(e)
+
+def upload_image(s3, upload_config, image_path, data):
+    """Upload one image to S3 (will overwrite if exists), from data if given,
+    otherwise straight from its file."""
+    s3_key = f"{S3_PREFIX}{image_path.name}"
+    if data is None:
+        s3.upload_file(image_path.path, S3_BUCKET, s3_key, ExtraArgs=EXTRA_ARGS, Config=upload_config)
+    else:
+        s3.upload_fileobj(io.BytesIO(data), S3_BUCKET, s3_key, ExtraArgs=EXTRA_ARGS, Config=upload_config)
+
+def progress_bar(iterable, total, desc):
+    """tqdm with sampled refreshes: at most ~200 redraws however many images there are."""
+    return tqdm(iterable, total=total, desc=desc,
+                miniters=max(1, total // 200), mininterval=0.5, smoothing=0.1)
+
+def run_pipeline(src, *, reencode=False, upload=False, dst=None):
+    """Process every .jpg in src.
+
+    reencode: re-save at 100% quality (images already at 100% are kept as-is)
+    upload: upload the results to S3, skipping objects already there with the same size
+    dst: folder to write the results into (may be src to overwrite in place)
+    """
+    image_files = list_images(src)
+    print(f"Found {len(image_files)} images in {src}")
+    if reencode:
+        print("Will uncompress to 100% quality...")
+    if dst is not None:
+        print(f"Output directory: {dst}")
+    if upload:
+        print(f"Destination: s3://{S3_BUCKET}/{S3_PREFIX} (existing images are replaced)")
+
+    success_count = 0
+    skipped_count = 0
+    error_count = 0
+
+    # Count tiny files as errors up front instead of processing them. stat()
+    # follows symlinks like the is_file() check in list_images, and DirEntry
+    # caches it for the S3 size comparison below.
+    valid_files = []
+    for image_path in image_files:
+        if image_path.stat().st_size < MIN_IMAGE_BYTES:
+            print(f"\nError processing {image_path.name}: file too small to be an image")
+            error_count += 1
+        else:
+            valid_files.append(image_path)
+
+    if dst is not None:
+        os.makedirs(dst, exist_ok=True)
+    if upload:
+        s3, upload_config = make_s3_client()
+        # Objects already in S3, so re-runs only send what changed
+        existing = list_existing_objects(s3)
+
+    # Encoding is CPU-bound and runs on all cores; each image is handed to the
+    # upload threads as soon as it is ready, so the two stages overlap. Both
+    # stages are capped at MAX_IN_FLIGHT images, so encoding waits for slow
+    # uploads instead of buffering every image in memory.
+    upload_slots = threading.BoundedSemaphore(MAX_IN_FLIGHT)
+    with ProcessPoolExecutor() as encode_pool, ThreadPoolExecutor(max_workers=MAX_WORKERS) as upload_pool:
+        if reencode or dst is not None:
+            worker = partial(process_image, reencode=reencode, dst=None if dst is None else str(dst), return_data=upload)
+            processed = bounded_map(encode_pool, worker, (e.path for e in valid_files), MAX_IN_FLIGHT)
+            processed = progress_bar(processed, len(valid_files), "Uncompressing" if reencode else "Copying")
+        else:
+            # Nothing to transform: upload the files as they are
+            processed = ((None, None) for _ in valid_files)
+
+        # Created up front so it moves while images are still being submitted;
+        # skipped and failed images count towards it too
+        upload_bar = progress_bar(None, len(valid_files), "Uploading") if upload else None
+
+        def upload_done(_):
+            upload_slots.release()
+            upload_bar.update()
+
+        upload_futures = {}
+        for image_path, (data, error) in zip(valid_files, processed, strict=True):
+            if error is not None:
+                print(f"\nError processing {image_path.name}: {error}")
+                error_count += 1
+                if upload:
+                    upload_bar.update()
+            elif not upload:
+                success_count += 1
+            elif existing.get(f"{S3_PREFIX}{image_path.name}") == (
+                image_path.stat().st_size if data is None else len(data)
+            ):
+                skipped_count += 1
+                upload_bar.update()
+            else:
+                upload_slots.acquire()
+                future = upload_pool.submit(upload_image, s3, upload_config, image_path, data)
+                future.add_done_callback(upload_done)
+                upload_futures[future] = image_path
+
+        for future in as_completed(upload_futures):
+            image_path = upload_futures[future]
+            try:
+                future.result()
+                success_count += 1
+
+            except Exception as e:
+                print(f"\nError uploading {image_path.name}: {e}")
+                error_count += 1
+        if upload:
+            upload_bar.close()
+
+    print("\n✅ Complete!")
+    print(f"   Success: {success_count} images")
+    if upload:
+        print(f"   Skipped (already in S3): {skipped_count} images")
+    print(f"   Errors: {error_count} images")
+    if dst is not None:
+        print(f"   Output: {dst}")
+    if upload:
+        print(f"   Location: s3://{S3_BUCKET}/{S3_PREFIX}")
@@ -0,0 +1,98 @@
+"""
+Shared file I/O for the SerpAPI scrapers (outscraper_hybrid_scraper.py and
+process_new_only.py): image downloads, the append-only checkpoint, and the
+results JSON array that grows in place.
+"""
+import json
+import os
+from pathlib import Path
+
+import requests
+
+
+def download_image(url: str, filepath: Path, session=None) -> bool:
+    """Download image from URL to filepath, over session if given."""
+    # Write to a .part file and only move it into place once the body is
+    # complete, so a failed download never leaves a truncated image behind
+    part_path = filepath.with_name(filepath.name + ".part")
+    try:
+        # Stream the body to disk in chunks instead of buffering the whole image
+        with (session or requests).get(url, stream=True, timeout=10) as response:
+            if response.status_code == 200:
+                size = int(response.headers.get("Content-Length", 0))
+                with open(part_path, "wb") as f:
+                    # Reserve the whole extent up front (not available on macOS)
+                    if size and hasattr(os, "posix_fallocate"):
+                        os.posix_fallocate(f.fileno(), 0, size)
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+                    # Drop any reserved tail the body didn't fill
+                    f.truncate()
+                os.replace(part_path, filepath)
+                return True
+    except Exception:
+        part_path.unlink(missing_ok=True)
+    return False
+
+
+def flush_checkpoint(fd: int, pending: bytearray):
+    """Write buffered place_ids to the checkpoint in a single write() call."""
+    if pending:
+        os.write(fd, pending)
+        del pending[:]
+
+
+def append_results(results_file: Path, entries: list[dict]):
+    """Append entries to the results_file JSON array without loading it.
+
+    Raises ValueError if the file is not empty and doesn't end with ']'.
+    """
+    if not entries:
+        return
+    # Compact, one entry per line: the file is machine-read, not reviewed by hand
+    payload = ",\n".join(
+        json.dumps(e, separators=(",", ":"), ensure_ascii=False) for e in entries
+    ).encode()
+
+    if not results_file.exists() or results_file.stat().st_size == 0:
+        results_file.write_bytes(b"[\n" + payload + b"\n]")
+        return
+
+    with open(results_file, "r+b") as f:
+        # Walk back over trailing whitespace to the closing bracket of the array
+        pos = f.seek(0, os.SEEK_END)
+        last = b""
+        while pos > 0:
+            pos -= 1
+            f.seek(pos)
+            last = f.read(1)
+            if not last.isspace():
+                break
+        if last != b"]":
+            raise ValueError(f"{results_file} does not end with a JSON array")
+        close_pos = pos
+        # Peek at the last token before it to tell an empty array apart
+        prev = b""
+        while pos > 0:
+            pos -= 1
+            f.seek(pos)
+            prev = f.read(1)
+            if not prev.isspace():
+                break
+
+        f.seek(close_pos)
+        old_tail = f.read()
+
+        # Overwrite the bracket with the new tail in a single write() and only
+        # then trim leftover whitespace, so a run killed mid-append leaves the
+        # file either as it was or complete, never without its closing bracket
+        tail = (b"\n" if prev == b"[" else b",\n") + payload + b"\n]"
+        try:
+            if os.pwrite(f.fileno(), tail, close_pos) != len(tail):
+                raise OSError(f"short write appending to {results_file}")
+        except BaseException:
+            # Put the original closing bracket back before giving up
+            os.pwrite(f.fileno(), old_tail, close_pos)
+            f.truncate(close_pos + len(old_tail))
+            raise
+        f.truncate(close_pos + len(tail))
@@ -12,10 +12,13 @@ import json
 import os
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Optional
 from outscraper import ApiClient
-from serpapi import GoogleSearch
+from requests.adapters import HTTPAdapter
+from _scraper_io import append_results, download_image, flush_checkpoint
 
 # ==============================================================================
 # CONFIG
@@ -29,6 +32,7 @@ SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY", "")
 OUTPUT_DIR = Path("./vibecheck_full_output")
 IMAGE_DIR = OUTPUT_DIR / "images"
 CHECKPOINT_FILE = OUTPUT_DIR / "checkpoint.json"
+PROCESSED_FILE = CHECKPOINT_FILE.with_suffix(".txt")
 RESTAURANTS_FILE = OUTPUT_DIR / "all_restaurants.json"
 RESULTS_FILE = OUTPUT_DIR / "vibecheck_results.json"
 
@@ -40,6 +44,15 @@ MIN_IMAGES_NEEDED = 5
 MIN_RATING = 3.5
 MIN_REVIEW_COUNT = 20
 
+# Concurrency: restaurants fetched in parallel, each worker sleeping
+# RATE_LIMIT_DELAY seconds between restaurants
+MAX_WORKERS = 8
+RATE_LIMIT_DELAY = 2
+
+# One keep-alive connection pool shared by SerpAPI calls and image downloads
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS * 4))
+
 # Manhattan neighborhood search queries
 MANHATTAN_QUERIES = [
     # Lower Manhattan
@@ -202,6 +215,7 @@ def get_vibe_photos_and_reviews(place_id: str, name: str) -> dict:
     Use SerpAPI to fetch vibe photos and reviews for a restaurant.
     Returns dict with reviews and photo URLs.
     """
+    url = "https://serpapi.com/search.json"
     params = {
         "engine": "google_maps_reviews",
         "place_id": place_id,
@@ -210,8 +224,11 @@ def get_vibe_photos_and_reviews(place_id: str, name: str) -> dict:
     }
 
     try:
-        search = GoogleSearch(params)
-        result = search.get_dict()
+        response = SESSION.get(url, params=params, timeout=30)
+        result = response.json()
+
+        if "error" in result:
+            raise RuntimeError(result["error"])
 
         reviews = result.get("reviews", [])
 
@@ -257,36 +274,47 @@ def get_vibe_photos_and_reviews(place_id: str, name: str) -> dict:
         print(f"      ⚠️  SerpAPI error for {name}: {e}")
         return {"reviews": [], "photo_urls": []}
 
-def download_image(url: str, filename: str) -> bool:
-    """Download image from URL to file."""
-    try:
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            filepath = IMAGE_DIR / filename
-            with open(filepath, "wb") as f:
-                f.write(response.content)
-            return True
-    except Exception:
-        pass
-    return False
+def fetch_restaurant(restaurant: dict) -> tuple[dict, dict, list[str]]:
+    """
+    Fetch SerpAPI data and download images for one restaurant.
+    Runs in a worker thread; returns (restaurant, vibe_data, downloaded_files).
+    """
+    place_id = restaurant["place_id"]
+    vibe_data = get_vibe_photos_and_reviews(place_id, restaurant.get("name", "Unknown"))
+
+    # Download all images for this restaurant concurrently
+    downloaded_files = []
+    photo_urls = vibe_data["photo_urls"]
+    if photo_urls:
+        filenames = [f"{place_id}_{i}.jpg" for i in range(1, len(photo_urls) + 1)]
+        with ThreadPoolExecutor(max_workers=len(photo_urls)) as pool:
+            fetch = partial(download_image, session=SESSION)
+            ok = list(pool.map(fetch, photo_urls, [IMAGE_DIR / f for f in filenames]))
+        downloaded_files = [f for f, success in zip(filenames, ok, strict=True) if success]
+
+    # Rate limiting (per worker)
+    time.sleep(RATE_LIMIT_DELAY)
+
+    return restaurant, vibe_data, downloaded_files
 
 # ==============================================================================
 # MAIN PIPELINE
 # ==============================================================================
 
 def load_checkpoint() -> set:
-    """Load checkpoint of processed restaurant IDs."""
+    """Load checkpoint of processed restaurant IDs (one place_id per line)."""
+    if PROCESSED_FILE.exists():
+        with open(PROCESSED_FILE) as f:
+            return set(f.read().splitlines())
+    # Migrate a legacy JSON checkpoint to the append-only text file
     if CHECKPOINT_FILE.exists():
         with open(CHECKPOINT_FILE) as f:
-            data = json.load(f)
-            return set(data.get("processed", []))
+            processed = set(json.load(f).get("processed", []))
+        with open(PROCESSED_FILE, "w") as f:
+            f.writelines(place_id + "\n" for place_id in processed)
+        return processed
     return set()
 
-def save_checkpoint(processed: set):
-    """Save checkpoint."""
-    with open(CHECKPOINT_FILE, "w") as f:
-        json.dump({"processed": list(processed)}, f)
-
 def main():
     print("\n" + "=" * 60)
     print("🗽 NYC MANHATTAN HYBRID SCRAPER")
@@ -335,89 +363,78 @@ def main():
     print("=" * 60)
 
     processed = load_checkpoint()
-    results = []
+    checkpoint = os.open(PROCESSED_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    pending = bytearray()
 
-    # Load existing results if any
-    if RESULTS_FILE.exists():
-        with open(RESULTS_FILE) as f:
-            results = json.load(f)
-
-    for idx, restaurant in enumerate(all_restaurants, 1):
-        place_id = restaurant.get("place_id", "")
-        name = restaurant.get("name", "Unknown")
-
-        if not place_id:
-            continue
-
-        # Skip if already processed
-        if place_id in processed:
-            print(f"[{idx}/{len(all_restaurants)}] ⏭️  {name} (already processed)")
-            continue
-
-        print(f"\n[{idx}/{len(all_restaurants)}] 🍽️  {name}")
-        rating = restaurant.get("rating", 0)
-        reviews_count = restaurant.get("reviews_count", 0)
-        print(f"   Rating: {rating} ⭐ ({reviews_count} reviews)")
-
-        # Get vibe photos and reviews from SerpAPI
-        print(f"   Fetching vibe photos and reviews...")
-        vibe_data = get_vibe_photos_and_reviews(place_id, name)
-
-        reviews = vibe_data["reviews"]
-        photo_urls = vibe_data["photo_urls"]
-
-        print(f"   Found: {len(reviews)} reviews, {len(photo_urls)} vibe photos")
-
-        # Download images
-        downloaded_files = []
-        if photo_urls:
-            print(f"   Downloading {len(photo_urls)} images...")
-            for i, url in enumerate(photo_urls, 1):
-                filename = f"{place_id}_{i}.jpg"
-                if download_image(url, filename):
-                    downloaded_files.append(filename)
-            print(f"   ✅ Downloaded {len(downloaded_files)} images")
-
-        # Build result entry
-        result_entry = {
-            "info": {
-                "name": name,
-                "place_id": place_id,
-                "rating": restaurant.get("rating", 0),
-                "reviews_count": restaurant.get("reviews_count", 0),
-                "address": restaurant.get("address", ""),
-                "phone": restaurant.get("phone", ""),
-                "website": restaurant.get("website", ""),
-                "category": restaurant.get("category", ""),
-                "latitude": restaurant.get("latitude"),
-                "longitude": restaurant.get("longitude"),
-            },
-            "reviews": reviews,
-            "downloaded_files": downloaded_files,
-        }
-
-        results.append(result_entry)
-        processed.add(place_id)
-
-        # Save checkpoint every 10 restaurants
-        if idx % 10 == 0:
-            with open(RESULTS_FILE, "w") as f:
-                json.dump(results, f, indent=2)
-            save_checkpoint(processed)
-            print(f"   💾 Checkpoint saved ({len(processed)}/{len(all_restaurants)})")
-
-        # Rate limiting
-        time.sleep(2)
+    # Results from earlier runs stay on disk; only this run's entries are kept
+    # in memory and appended to RESULTS_FILE at each checkpoint
+    results = []
+    flushed = 0
+
+    remaining = [
+        r for r in all_restaurants
+        if r.get("place_id") and r["place_id"] not in processed
+    ]
+    print(f"⏭️  {len(all_restaurants) - len(remaining)} already processed, {len(remaining)} to go")
+
+    # Workers fetch restaurants in parallel; results come back in order and all
+    # bookkeeping (results, checkpoint) stays on this thread
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        fetched = pool.map(fetch_restaurant, remaining)
+        for idx, (restaurant, vibe_data, downloaded_files) in enumerate(fetched, 1):
+            place_id = restaurant["place_id"]
+            name = restaurant.get("name", "Unknown")
+
+            print(f"\n[{idx}/{len(remaining)}] 🍽️  {name}")
+            rating = restaurant.get("rating", 0)
+            reviews_count = restaurant.get("reviews_count", 0)
+            print(f"   Rating: {rating} ⭐ ({reviews_count} reviews)")
+
+            reviews = vibe_data["reviews"]
+            photo_urls = vibe_data["photo_urls"]
+
+            print(f"   Found: {len(reviews)} reviews, {len(photo_urls)} vibe photos")
+            if photo_urls:
+                print(f"   ✅ Downloaded {len(downloaded_files)} images")
+
+            # Build result entry
+            result_entry = {
+                "info": {
+                    "name": name,
+                    "place_id": place_id,
+                    "rating": restaurant.get("rating", 0),
+                    "reviews_count": restaurant.get("reviews_count", 0),
+                    "address": restaurant.get("address", ""),
+                    "phone": restaurant.get("phone", ""),
+                    "website": restaurant.get("website", ""),
+                    "category": restaurant.get("category", ""),
+                    "latitude": restaurant.get("latitude"),
+                    "longitude": restaurant.get("longitude"),
+                },
+                "reviews": reviews,
+                "downloaded_files": downloaded_files,
+            }
+
+            results.append(result_entry)
+            processed.add(place_id)
+            pending += place_id.encode() + b"\n"
+
+            # Save checkpoint every 10 restaurants
+            if idx % 10 == 0:
+                append_results(RESULTS_FILE, results[flushed:])
+                flushed = len(results)
+                flush_checkpoint(checkpoint, pending)
+                print(f"   💾 Checkpoint saved ({len(processed)}/{len(all_restaurants)})")
 
     # Final save
-    with open(RESULTS_FILE, "w") as f:
-        json.dump(results, f, indent=2)
-    save_checkpoint(processed)
+    append_results(RESULTS_FILE, results[flushed:])
+    flush_checkpoint(checkpoint, pending)
+    os.close(checkpoint)
 
     print("\n" + "=" * 60)
     print("✅ SCRAPING COMPLETE")
     print("=" * 60)
-    print(f"🍽️  Total restaurants: {len(results)}")
+    print(f"🍽️  Restaurants this run: {len(results)}")
     print(f"📝 Total reviews: {sum(len(r['reviews']) for r in results)}")
     print(f"📷 Total vibe photos: {sum(len(r['downloaded_files']) for r in results)}")
     print(f"\n💾 Saved to: {RESULTS_FILE}")
@@ -7,9 +7,9 @@ Does NOT touch the old 2,972 restaurants
 import json
 import os
 import time
-import requests
 from pathlib import Path
 from serpapi import GoogleSearch
+from _scraper_io import append_results, download_image, flush_checkpoint
 
 # ==============================================================================
 # CONFIG
@@ -21,6 +21,7 @@ OUTPUT_DIR = Path("./vibecheck_full_output")
 IMAGE_DIR = OUTPUT_DIR / "images"
 NEW_RESTAURANTS_FILE = OUTPUT_DIR / "new_restaurants_only.json"
 CHECKPOINT_FILE = OUTPUT_DIR / "checkpoint.json"
+PROCESSED_FILE = CHECKPOINT_FILE.with_suffix(".txt")
 RESULTS_FILE = OUTPUT_DIR / "vibecheck_results.json"
 
 MIN_REVIEWS_NEEDED = 5
@@ -83,19 +84,6 @@ def get_vibe_photos_and_reviews(place_id: str, name: str) -> dict:
         print(f"      ⚠️  SerpAPI error for {name}: {e}")
         return {"reviews": [], "photo_urls": []}
 
-def download_image(url: str, filename: str) -> bool:
-    """Download image from URL to file."""
-    try:
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            filepath = IMAGE_DIR / filename
-            with open(filepath, "wb") as f:
-                f.write(response.content)
-            return True
-    except Exception:
-        pass
-    return False
-
 # ==============================================================================
 # MAIN
 # ==============================================================================
@@ -123,25 +111,36 @@ def main():
 
     # Load checkpoint
     processed = set()
-    if CHECKPOINT_FILE.exists():
+    if PROCESSED_FILE.exists():
+        with open(PROCESSED_FILE) as f:
+            processed = set(f.read().splitlines())
+        print(f"✅ Loaded checkpoint: {len(processed)} already processed")
+    elif CHECKPOINT_FILE.exists():
+        # Migrate a legacy JSON checkpoint to the append-only text file
         with open(CHECKPOINT_FILE) as f:
-            checkpoint = json.load(f)
-            processed = set(checkpoint.get("processed", []))
+            processed = set(json.load(f).get("processed", []))
+        with open(PROCESSED_FILE, "w") as f:
+            f.writelines(place_id + "\n" for place_id in processed)
         print(f"✅ Loaded checkpoint: {len(processed)} already processed")
+    checkpoint = os.open(PROCESSED_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    pending = bytearray()
 
-    # Load existing results
+    # Results from earlier runs stay on disk; only this run's entries are kept
+    # in memory and appended to RESULTS_FILE at each checkpoint
     results = []
-    if RESULTS_FILE.exists():
-        with open(RESULTS_FILE) as f:
-            results = json.load(f)
-        print(f"✅ Loaded existing results: {len(results)} restaurants")
+    flushed = 0
 
     # Filter: only process NEW restaurants that haven't been processed yet
-    new_place_ids = set(r["place_id"] for r in new_restaurants)
-    to_process = [r for r in new_restaurants if r["place_id"] not in processed]
+    to_process = []
+    already_done = 0
+    for r in new_restaurants:
+        if r["place_id"] in processed:
+            already_done += 1
+        else:
+            to_process.append(r)
 
     print(f"\n🎯 Will process: {len(to_process)} NEW restaurants")
-    print(f"   Already done: {len(new_place_ids & processed)} NEW")
+    print(f"   Already done: {already_done} NEW")
     print(f"   Total NEW: {len(new_restaurants)}")
 
     # Process
@@ -172,7 +171,7 @@ def main():
             print(f"   Downloading {len(photo_urls)} images...")
             for i, url in enumerate(photo_urls, 1):
                 filename = f"{place_id}_{i}.jpg"
-                if download_image(url, filename):
+                if download_image(url, IMAGE_DIR / filename):
                     downloaded_files.append(filename)
             print(f"   ✅ Downloaded {len(downloaded_files)} images")
 
@@ -196,28 +195,27 @@ def main():
 
         results.append(result_entry)
         processed.add(place_id)
+        pending += place_id.encode() + b"\n"
 
         # Save checkpoint every 10 restaurants
         if idx % 10 == 0:
-            with open(RESULTS_FILE, "w") as f:
-                json.dump(results, f, indent=2)
-            with open(CHECKPOINT_FILE, "w") as f:
-                json.dump({"processed": list(processed)}, f)
+            append_results(RESULTS_FILE, results[flushed:])
+            flushed = len(results)
+            flush_checkpoint(checkpoint, pending)
             print(f"   💾 Checkpoint saved ({len(processed)} total processed)")
 
         # Rate limiting
         time.sleep(2)
 
     # Final save
-    with open(RESULTS_FILE, "w") as f:
-        json.dump(results, f, indent=2)
-    with open(CHECKPOINT_FILE, "w") as f:
-        json.dump({"processed": list(processed)}, f)
+    append_results(RESULTS_FILE, results[flushed:])
+    flush_checkpoint(checkpoint, pending)
+    os.close(checkpoint)
 
     print("\n" + "=" * 60)
     print("✅ PROCESSING COMPLETE")
     print("=" * 60)
-    print(f"🍽️  Total restaurants in results: {len(results)}")
+    print(f"🍽️  Restaurants added this run: {len(results)}")
     print(f"📝 Total reviews: {sum(len(r['reviews']) for r in results)}")
     print(f"📷 Total vibe photos: {sum(len(r['downloaded_files']) for r in results)}")
     print(f"\n💾 Saved to: {RESULTS_FILE}")
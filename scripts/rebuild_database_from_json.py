@@ -9,6 +9,11 @@ import json
 import sqlite3
 from pathlib import Path
 
+try:
+    import ijson  # streams one restaurant at a time; picks the C backend when available
+except ImportError:
+    ijson = None
+
 # ==============================================================================
 # CONFIG
 # ==============================================================================
@@ -22,6 +27,14 @@ BACKUP_DB_PATH = INPUT_DIR / "vibecheck_backup_before_rebuild.db"
 # MAIN
 # ==============================================================================
 
+def iter_restaurants(f):
+    """Yield restaurant entries from the results JSON array."""
+    if ijson is not None:
+        yield from ijson.items(f, "item", use_float=True)
+    else:
+        yield from json.load(f)
+
+
 def main():
     print("\n" + "=" * 60)
     print("🔧 REBUILDING VIBECHECK DATABASE FROM SOURCE JSON")
@@ -43,15 +56,17 @@ def main():
         print(f"\n🗑️  Deleting corrupted database...")
         DB_PATH.unlink()
 
-    # Load JSON data
-    print(f"\n📂 Reading data from {RESULTS_FILE}...")
-    with open(RESULTS_FILE) as f:
-        data = json.load(f)
-    print(f"✅ Loaded {len(data)} restaurants")
-
     # Initialize database
     print(f"\n📊 Creating new database at {DB_PATH}...")
     conn = sqlite3.connect(DB_PATH)
+    # Bulk-load settings: WAL with relaxed syncs, big page cache, memory-mapped I/O
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-65536;
+    """)
     cursor = conn.cursor()
 
     # Create tables
@@ -62,7 +77,7 @@ def main():
         CREATE TABLE restaurants (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
-            place_id TEXT UNIQUE NOT NULL,
+            place_id TEXT NOT NULL,
             data_id TEXT,
             address TEXT,
             rating REAL,
@@ -107,8 +122,11 @@ def main():
 
     print("✅ Tables created")
 
-    # Load data
-    print(f"\n🔄 Loading data into database...")
+    # Indexes (including the place_id uniqueness) are built after the bulk load
+    # so inserts don't pay per-row B-tree maintenance
+
+    # Load data, streaming restaurants straight from the JSON file
+    print(f"\n🔄 Loading data from {RESULTS_FILE} into database...")
     restaurants_loaded = 0
     reviews_loaded = 0
     photos_loaded = 0
@@ -118,76 +136,84 @@ def main():
     # Track seen place_ids to avoid duplicates
     seen_place_ids = set()
 
-    for i, restaurant in enumerate(data):
-        if (i + 1) % 100 == 0:
-            print(f"   Processed {i + 1}/{len(data)} restaurants...")
-
-        info = restaurant.get("info", {})
-        place_id = info.get("place_id")
-
-        # Skip if we've already seen this place_id
-        if place_id in seen_place_ids:
-            skipped_duplicates += 1
-            continue
-
-        seen_place_ids.add(place_id)
-
-        # Insert restaurant
-        cursor.execute("""
-            INSERT INTO restaurants
-            (name, place_id, data_id, address, rating, reviews_count, neighborhood, price_level)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            info.get("name"),
-            place_id,
-            info.get("data_id"),
-            info.get("address"),
-            info.get("rating"),
-            info.get("reviews_count"),
-            info.get("neighborhood"),
-            info.get("price_level")
-        ))
-
-        restaurant_id = cursor.lastrowid
-        restaurants_loaded += 1
-
-        # Insert reviews (ONLY for this restaurant)
-        for review in restaurant.get("reviews", []):
+    with open(RESULTS_FILE, "rb") as results_file:
+        for i, restaurant in enumerate(iter_restaurants(results_file)):
+            if (i + 1) % 100 == 0:
+                print(f"   Processed {i + 1} restaurants...")
+
+            info = restaurant.get("info", {})
+            place_id = info.get("place_id")
+
+            # Skip if we've already seen this place_id
+            if place_id in seen_place_ids:
+                skipped_duplicates += 1
+                continue
+
+            seen_place_ids.add(place_id)
+
+            # Insert restaurant
             cursor.execute("""
-                INSERT INTO reviews (restaurant_id, review_text, likes)
-                VALUES (?, ?, ?)
+                INSERT INTO restaurants
+                (name, place_id, data_id, address, rating, reviews_count, neighborhood, price_level)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """, (
-                restaurant_id,
-                review.get("text", ""),
-                review.get("likes", 0)
+                info.get("name"),
+                place_id,
+                info.get("data_id"),
+                info.get("address"),
+                info.get("rating"),
+                info.get("reviews_count"),
+                info.get("neighborhood"),
+                info.get("price_level")
             ))
-            reviews_loaded += 1
 
-        # Insert vibe photos - use ALL downloaded files, not just vibe_photos URLs
-        photo_urls = restaurant.get("vibe_photos", [])
-        downloaded_files = restaurant.get("downloaded_files", [])
+            restaurant_id = cursor.lastrowid
+            restaurants_loaded += 1
 
-        # Insert all downloaded files (AI-classified and ordered)
-        for j, local_file in enumerate(downloaded_files):
-            url = photo_urls[j] if j < len(photo_urls) else None
-            cursor.execute("""
+            # Insert reviews (ONLY for this restaurant)
+            reviews = restaurant.get("reviews", [])
+            cursor.executemany("""
+                INSERT INTO reviews (restaurant_id, review_text, likes)
+                VALUES (?, ?, ?)
+            """, [
+                (restaurant_id, review.get("text", ""), review.get("likes", 0))
+                for review in reviews
+            ])
+            reviews_loaded += len(reviews)
+
+            # Insert vibe photos - use ALL downloaded files, not just vibe_photos URLs
+            photo_urls = restaurant.get("vibe_photos", [])
+            downloaded_files = restaurant.get("downloaded_files", [])
+
+            # Insert all downloaded files (AI-classified and ordered)
+            cursor.executemany("""
                 INSERT INTO vibe_photos (restaurant_id, photo_url, local_filename)
                 VALUES (?, ?, ?)
-            """, (restaurant_id, url, local_file))
-            photos_loaded += 1
+            """, [
+                (restaurant_id, photo_urls[j] if j < len(photo_urls) else None, local_file)
+                for j, local_file in enumerate(downloaded_files)
+            ])
+            photos_loaded += len(downloaded_files)
 
-        # Insert vibe analysis
-        vibe_data = restaurant.get("vibe_analysis", {})
-        top_vibes = vibe_data.get("top_vibes", [])
+            # Insert vibe analysis
+            vibe_data = restaurant.get("vibe_analysis", {})
+            top_vibes = vibe_data.get("top_vibes", [])
 
-        for vibe_name, count in top_vibes:
-            cursor.execute("""
+            cursor.executemany("""
                 INSERT INTO vibe_analysis (restaurant_id, vibe_name, mention_count)
                 VALUES (?, ?, ?)
-            """, (restaurant_id, vibe_name, count))
-            vibes_loaded += 1
+            """, [(restaurant_id, vibe_name, count) for vibe_name, count in top_vibes])
+            vibes_loaded += len(top_vibes)
+
+    # Build indexes in one pass now that the data is loaded
+    print("   Creating indexes...")
+    cursor.execute("CREATE UNIQUE INDEX idx_pid ON restaurants(place_id)")
+    cursor.execute("CREATE INDEX idx_rev_resto ON reviews(restaurant_id)")
+    cursor.execute("CREATE INDEX idx_ph_resto ON vibe_photos(restaurant_id)")
 
     conn.commit()
+    # Leave a self-contained single-file database behind for the app
+    conn.execute("PRAGMA journal_mode=DELETE")
     conn.close()
 
     print(f"\n✅ Database rebuild complete!")
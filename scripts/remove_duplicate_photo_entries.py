@@ -15,10 +15,12 @@ def remove_duplicates():
     print("REMOVING DUPLICATE PHOTO ENTRIES")
     print("=" * 80)
 
-    # Find duplicates
+    # Find duplicates. Rows without a local file (photo_urls beyond the
+    # downloaded files) each hold a different URL and are not duplicates.
     cursor.execute("""
         SELECT restaurant_id, local_filename, COUNT(*) as count
         FROM vibe_photos
+        WHERE restaurant_id IS NOT NULL AND local_filename IS NOT NULL
         GROUP BY restaurant_id, local_filename
         HAVING count > 1
         ORDER BY count DESC
@@ -31,34 +33,31 @@ def remove_duplicates():
     print(f"Total duplicate entries to delete: {total_to_delete}")
 
     # Show sample
+    id_to_name = dict(cursor.execute("SELECT id, name FROM restaurants"))
     print("\nSample duplicates:")
     for resto_id, filename, count in duplicates[:10]:
-        cursor.execute("SELECT name FROM restaurants WHERE id = ?", (resto_id,))
-        resto_name = cursor.fetchone()[0]
+        resto_name = id_to_name.get(resto_id, "Unknown")
         print(f"  {resto_name}: {filename} ({count} copies)")
 
-    deleted_count = 0
-
-    for resto_id, filename, count in duplicates:
-        # Get all IDs for this duplicate
-        cursor.execute("""
-            SELECT id FROM vibe_photos
-            WHERE restaurant_id = ? AND local_filename = ?
-            ORDER BY id
-        """, (resto_id, filename))
-
-        ids = [row[0] for row in cursor.fetchall()]
-
-        # Keep the first one, delete the rest
-        ids_to_delete = ids[1:]
-
-        for photo_id in ids_to_delete:
-            cursor.execute("DELETE FROM vibe_photos WHERE id = ?", (photo_id,))
-            deleted_count += 1
-
-        if deleted_count % 100 == 0:
-            print(f"  Deleted {deleted_count}/{total_to_delete} duplicates...")
-
+    # Index the grouping columns, then keep the lowest id of each group in one
+    # statement (NULL columns never compare equal, so those rows are left alone)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_resto_file
+        ON vibe_photos(restaurant_id, local_filename)
+    """)
+    cursor.execute("""
+        DELETE FROM vibe_photos
+        WHERE restaurant_id IS NOT NULL AND local_filename IS NOT NULL
+        AND id NOT IN (
+            SELECT MIN(id)
+            FROM vibe_photos
+            WHERE restaurant_id IS NOT NULL AND local_filename IS NOT NULL
+            GROUP BY restaurant_id, local_filename
+        )
+    """)
+    deleted_count = cursor.rowcount
+    # The index was only needed for the grouping above
+    cursor.execute("DROP INDEX idx_resto_file")
     conn.commit()
 
     print(f"\n✓ Deleted {deleted_count} duplicate photo entries")
@@ -74,6 +73,7 @@ def remove_duplicates():
         FROM (
             SELECT restaurant_id, local_filename, COUNT(*) as count
             FROM vibe_photos
+            WHERE restaurant_id IS NOT NULL AND local_filename IS NOT NULL
             GROUP BY restaurant_id, local_filename
             HAVING count > 1
         )
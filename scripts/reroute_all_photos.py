@@ -7,14 +7,14 @@ from pathlib import Path
 
 DB_PATH = Path(__file__).parent.parent / "vibecheck_full_output" / "vibecheck.db"
 
+# Punctuation dropped from names before comparison, removed in a single pass
+_NORMALIZE_TABLE = str.maketrans("", "", "'&,-.|")
+
 def normalize_name(name):
     """Normalize a name for comparison (remove special chars, spaces, etc)."""
-    normalized = name.upper()
-    normalized = normalized.replace("'", "").replace("&", "").replace(",", "")
-    normalized = normalized.replace("-", "").replace(".", "").replace("|", "")
-    normalized = normalized.replace("  ", " ").replace(" ", "_")
-    normalized = normalized.strip("_")
-    return normalized
+    normalized = name.upper().translate(_NORMALIZE_TABLE)
+    normalized = normalized.replace("  ", "_").replace(" ", "_")
+    return normalized.strip("_")
 
 def extract_restaurant_name_from_filename(filename):
     """Extract restaurant name from photo filename (everything before _vibe_)."""
@@ -24,15 +24,17 @@ def extract_restaurant_name_from_filename(filename):
     return name_part.upper()
 
 def find_best_matching_restaurant(photo_name, restaurants):
-    """Find the best matching restaurant for a photo filename."""
+    """Find the best matching restaurant for a photo filename.
+
+    `restaurants` holds (id, name, normalized_name) tuples.
+    """
     if not photo_name:
         return None, None, 0
 
     best_match = None
     best_score = 0
 
-    for resto_id, resto_name in restaurants:
-        normalized_resto = normalize_name(resto_name)
+    for resto_id, resto_name, normalized_resto in restaurants:
 
         # Exact match
         if normalized_resto == photo_name:
@@ -59,6 +61,14 @@ def find_best_matching_restaurant(photo_name, restaurants):
 
 def reroute_photos():
     conn = sqlite3.connect(DB_PATH)
+    # Bulk-update settings: WAL with relaxed syncs, big page cache, memory-mapped I/O
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-65536;
+    """)
     cursor = conn.cursor()
 
     print("=" * 80)
@@ -68,6 +78,12 @@ def reroute_photos():
     # Get all restaurants
     cursor.execute("SELECT id, name FROM restaurants ORDER BY id")
     restaurants = cursor.fetchall()
+    id_to_name = dict(restaurants)
+    # Normalize each restaurant name once rather than once per photo
+    restaurants = [
+        (resto_id, resto_name, normalize_name(resto_name))
+        for resto_id, resto_name in restaurants
+    ]
     print(f"\nLoaded {len(restaurants)} restaurants")
 
     # Get all vibe photos
@@ -137,10 +153,7 @@ def reroute_photos():
     # Show sample of reroutes
     print("\nSample reroutes (first 20):")
     for reroute in reroutes[:20]:
-        # Get old restaurant name
-        cursor.execute("SELECT name FROM restaurants WHERE id = ?", (reroute['old_id'],))
-        old_name_result = cursor.fetchone()
-        old_name = old_name_result[0] if old_name_result else "Unknown"
+        old_name = id_to_name.get(reroute['old_id'], "Unknown")
         print(f"  {reroute['filename']}")
         print(f"    FROM: {old_name} (ID {reroute['old_id']})")
         print(f"    TO:   {reroute['new_name']} (ID {reroute['new_id']}) [{reroute['confidence']:.1f}%]")
@@ -153,19 +166,19 @@ def reroute_photos():
     print("APPLYING REROUTES (NO DELETIONS)")
     print("=" * 80)
 
-    for i, reroute in enumerate(reroutes, 1):
-        cursor.execute("""
-            UPDATE vibe_photos
-            SET restaurant_id = ?
-            WHERE id = ?
-        """, (reroute['new_id'], reroute['photo_id']))
-
-        if i % 100 == 0:
-            print(f"  Rerouted {i}/{len(reroutes)} photos...")
-
+    # One prepared UPDATE reused for every reroute, inside a single transaction
+    cursor.execute("BEGIN")
+    cursor.executemany("""
+        UPDATE vibe_photos
+        SET restaurant_id = ?
+        WHERE id = ?
+    """, ((reroute['new_id'], reroute['photo_id']) for reroute in reroutes))
     conn.commit()
     print(f"✓ Rerouted {len(reroutes)} photos")
 
+    # Refresh planner statistics after the bulk update
+    cursor.execute("ANALYZE")
+
     # Final statistics
     cursor.execute("SELECT COUNT(*) FROM vibe_photos")
     final_count = cursor.fetchone()[0]
@@ -177,6 +190,7 @@ def reroute_photos():
     print(f"Photos rerouted: {len(reroutes)}")
     print(f"Photos that couldn't be matched: {len(no_match_photos)}")
 
+    conn.execute("PRAGMA journal_mode=DELETE")
     conn.close()
 
     return stats, reroutes
@@ -18,6 +18,15 @@ CURRENT_DB = OUTPUT_DIR / "vibecheck.db"
 BACKUP_DB = OUTPUT_DIR / "backups/vibecheck_backup_20251222_234838.db"
 BACKUP_CURRENT = OUTPUT_DIR / "vibecheck_backup_before_review_restore.db"
 
+# Copies every backup review onto the current restaurant with the same place_id
+INSERT_SQL = """
+    INSERT INTO reviews (restaurant_id, review_text, likes)
+    SELECT cur.id, br.review_text, br.likes
+    FROM bak.reviews br
+    JOIN bak.restaurants bres ON bres.id = br.restaurant_id
+    JOIN restaurants cur ON cur.place_id = bres.place_id
+    ORDER BY cur.id, br.id
+"""
 # ==============================================================================
 # MAIN
 # ==============================================================================
@@ -37,67 +46,74 @@ def main():
     shutil.copy2(CURRENT_DB, BACKUP_CURRENT)
     print("✅ Backup complete")
 
-    # Connect to both databases
-    current_conn = sqlite3.connect(CURRENT_DB)
+    # Connect to the current database
+    # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE
+    current_conn = sqlite3.connect(
+        CURRENT_DB, isolation_level=None, cached_statements=512, uri=True
+    )
+    # The current DB was just copied to BACKUP_CURRENT, so trade crash
+    # durability for fewer syncs and a large page cache during the restore;
+    # the raised autocheckpoint keeps WAL checkpoints from stalling the load
+    current_conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA wal_autocheckpoint=100000;
+        PRAGMA synchronous=OFF;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-200000;
+        PRAGMA locking_mode=EXCLUSIVE;
+        PRAGMA mmap_size=268435456;
+    """)
     current_conn.row_factory = sqlite3.Row
     current_cursor = current_conn.cursor()
 
-    backup_conn = sqlite3.connect(BACKUP_DB)
-    backup_conn.row_factory = sqlite3.Row
-    backup_cursor = backup_conn.cursor()
+    # Attach the backup read-only so reviews can be copied with a single statement
+    current_conn.execute(
+        "ATTACH DATABASE ? AS bak", (f"{BACKUP_DB.resolve().as_uri()}?mode=ro",)
+    )
+
+    # Clear and restore reviews in one transaction
+    current_conn.execute("PRAGMA foreign_keys=OFF")
+    current_conn.execute("BEGIN IMMEDIATE")
+
+    # Drop the reviews indexes for the bulk load; they are rebuilt in one pass below
+    current_cursor.execute("""
+        SELECT name, sql FROM sqlite_master
+        WHERE type = 'index' AND tbl_name = 'reviews' AND sql IS NOT NULL
+    """)
+    review_indexes = current_cursor.fetchall()
+    for index in review_indexes:
+        current_cursor.execute(f'DROP INDEX "{index["name"]}"')
 
-    # Clear existing reviews in current database
     print(f"\n🗑️  Clearing existing reviews...")
     current_cursor.execute("DELETE FROM reviews")
-    current_conn.commit()
-
-    # Get place_id to restaurant_id mapping from CURRENT database
-    print(f"\n📊 Building place_id mappings...")
-    current_cursor.execute("SELECT id, place_id FROM restaurants")
-    place_id_to_current_id = {row['place_id']: row['id'] for row in current_cursor.fetchall()}
-    print(f"   Found {len(place_id_to_current_id)} restaurants in current DB")
 
-    # Get place_id mapping from BACKUP database
-    backup_cursor.execute("SELECT id, place_id FROM restaurants")
-    place_id_to_backup_id = {row['place_id']: row['id'] for row in backup_cursor.fetchall()}
-    print(f"   Found {len(place_id_to_backup_id)} restaurants in backup DB")
+    # Match restaurants across both databases by place_id
+    print(f"\n📊 Matching restaurants by place_id...")
+    current_cursor.execute("SELECT COUNT(*) FROM restaurants")
+    print(f"   Found {current_cursor.fetchone()[0]} restaurants in current DB")
+    current_cursor.execute("SELECT COUNT(*) FROM bak.restaurants")
+    print(f"   Found {current_cursor.fetchone()[0]} restaurants in backup DB")
+    current_cursor.execute("""
+        SELECT COUNT(*)
+        FROM restaurants cur
+        WHERE NOT EXISTS (
+            SELECT 1 FROM bak.restaurants bres WHERE bres.place_id = cur.place_id
+        )
+    """)
+    skipped_restaurants = current_cursor.fetchone()[0]
 
-    # Copy reviews using place_id matching
+    # Copy reviews using place_id matching, entirely inside SQLite
     print(f"\n🔄 Copying reviews from backup...")
-    reviews_copied = 0
-    restaurants_with_reviews = 0
-    skipped_restaurants = 0
-
-    for place_id, current_rest_id in place_id_to_current_id.items():
-        backup_rest_id = place_id_to_backup_id.get(place_id)
-
-        if not backup_rest_id:
-            skipped_restaurants += 1
-            continue
-
-        # Get reviews from backup for this restaurant
-        backup_cursor.execute("""
-            SELECT review_text, likes
-            FROM reviews
-            WHERE restaurant_id = ?
-        """, (backup_rest_id,))
-
-        reviews = backup_cursor.fetchall()
-
-        if reviews:
-            restaurants_with_reviews += 1
-            for review in reviews:
-                current_cursor.execute("""
-                    INSERT INTO reviews (restaurant_id, review_text, likes)
-                    VALUES (?, ?, ?)
-                """, (current_rest_id, review['review_text'], review['likes']))
-                reviews_copied += 1
-
-        if restaurants_with_reviews % 100 == 0:
-            print(f"   Processed {restaurants_with_reviews} restaurants...")
+    current_cursor.execute(INSERT_SQL)
+    reviews_copied = current_cursor.rowcount
 
+    for index in review_indexes:
+        current_cursor.execute(index["sql"])
     current_conn.commit()
 
+    current_cursor.execute("SELECT COUNT(DISTINCT restaurant_id) FROM reviews")
+    restaurants_with_reviews = current_cursor.fetchone()[0]
+
     print(f"\n✅ Review restoration complete!")
     print(f"\n📊 STATISTICS:")
     print(f"   🍽️  Restaurants with reviews: {restaurants_with_reviews}")
@@ -106,12 +122,19 @@ def main():
 
     # Verify
     print(f"\n🔍 Verifying restoration...")
+    # Same index the rebuild script creates; lets the count run as an index scan
+    current_cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_rev_resto ON reviews(restaurant_id)"
+    )
     current_cursor.execute("""
-        SELECT name, COUNT(r.id) as review_count
-        FROM restaurants rest
-        JOIN reviews r ON rest.id = r.restaurant_id
-        GROUP BY rest.id
-        ORDER BY review_count DESC
+        SELECT rest.name, x.review_count
+        FROM (
+            SELECT restaurant_id, COUNT(*) AS review_count
+            FROM reviews
+            GROUP BY restaurant_id
+        ) x
+        JOIN restaurants rest ON rest.id = x.restaurant_id
+        ORDER BY x.review_count DESC
         LIMIT 5
     """)
 
@@ -119,8 +142,11 @@ def main():
     for row in current_cursor.fetchall():
         print(f"   {row['name']}: {row['review_count']} reviews")
 
+    # Leave a self-contained single-file database behind for the app
+    current_conn.execute("DETACH DATABASE bak")
+    current_conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    current_conn.execute("PRAGMA journal_mode=DELETE")
     current_conn.close()
-    backup_conn.close()
 
     print("\n" + "=" * 60)
     print("✅ REVIEW RESTORATION COMPLETE")
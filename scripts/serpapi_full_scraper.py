@@ -15,15 +15,37 @@ Configuration:
     - All output paths controlled via config.py
 """
 
+import hashlib
 import json
 import os
 import re
+import shutil
 import sys
+import threading
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import timedelta
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import re2 as vibe_re  # google-re2: linear-time matching, no backtracking
+except ImportError:
+    vibe_re = re
+
+try:
+    from requests_cache import DO_NOT_CACHE, CachedSession
+except ImportError:
+    CachedSession = None
+
+try:
+    import orjson  # faster JSON parsing/serialization when installed
+except ImportError:
+    orjson = None
 
 # Add parent directory to path to import config
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -54,6 +76,116 @@ IMAGES_NEEDED = MIN_IMAGES_NEEDED
 OUTPUT_DIR = SCRAPER_OUTPUT_DIR
 IMAGES_DIR = SCRAPER_IMAGES_DIR
 
+# Append-only log of successful results, one JSON object per line
+RESULTS_LOG_FILE = VIBECHECK_RESULTS_FILE.with_suffix(".jsonl")
+
+# Restaurants processed in parallel
+MAX_WORKERS = 16
+
+# Photo downloads in flight at once, across all restaurants (one shared pool,
+# so this also bounds the connections needed to the image host)
+DOWNLOAD_WORKERS = 32
+
+# SerpAPI requests per second shared by all workers (lower this if SerpAPI
+# starts rate limiting)
+SERPAPI_RPS = 5
+
+# One keep-alive connection pool shared by all worker threads. With
+# requests-cache installed, SerpAPI responses are cached on disk (keyed without
+# the api_key) so re-runs don't spend quota; image downloads are never cached.
+if CachedSession is not None:
+    SESSION = CachedSession(
+        str(OUTPUT_DIR / "serpapi_cache"),
+        backend="sqlite",
+        expire_after=DO_NOT_CACHE,
+        urls_expire_after={"serpapi.com": timedelta(days=30)},
+        allowable_methods=("GET",),
+        ignored_parameters=["api_key"],
+    )
+else:
+    SESSION = requests.Session()
+# Per-host pools sized to the peak concurrency, so no connection is discarded:
+# DOWNLOAD_WORKERS to the image host, MAX_WORKERS * 2 to SerpAPI (each worker
+# fetches photos and reviews in parallel)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=MAX_WORKERS,
+    pool_maxsize=max(DOWNLOAD_WORKERS, MAX_WORKERS * 2),
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rps` acquisitions per second on average.
+
+    `acquired` counts tokens handed out, i.e. the SerpAPI calls made so far
+    (cache hits don't take one, see serpapi_get).
+    """
+
+    def __init__(self, rps: float, burst: float | None = None):
+        self.rps = rps
+        self.capacity = burst or rps
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.acquired = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rps)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    self.acquired += 1
+                    return
+                wait = (1 - self.tokens) / self.rps
+            time.sleep(wait)
+
+
+SERPAPI_LIMITER = TokenBucket(SERPAPI_RPS)
+
+# Shared by every restaurant worker; see DOWNLOAD_WORKERS
+DOWNLOAD_POOL = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
+
+
+def serpapi_get(url: str, params: dict) -> requests.Response:
+    """GET a SerpAPI endpoint, serving it from the local cache when possible.
+
+    Only requests that actually reach SerpAPI wait for (and count as) a
+    SERPAPI_LIMITER token; cache hits return immediately.
+    """
+    if CachedSession is not None:
+        # A miss comes back as a synthetic 504 (only 200s are ever cached)
+        # without touching the network
+        response = SESSION.get(url, params=params, timeout=30, only_if_cached=True)
+        if response.status_code != 504:
+            return response
+    SERPAPI_LIMITER.acquire()
+    return SESSION.get(url, params=params, timeout=30)
+
+# ==============================================================================
+# JSON HELPERS
+# ==============================================================================
+
+
+def _json(response) -> dict:
+    """Decode a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, compact unless indent is set."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str).encode()
+
+
 # ==============================================================================
 # CHECKPOINT FUNCTIONS
 # ==============================================================================
@@ -68,9 +200,21 @@ def load_checkpoint() -> dict:
 
 
 def save_checkpoint(checkpoint: dict):
-    """Save checkpoint to file after each restaurant."""
-    with open(CHECKPOINT_FILE, "w") as f:
-        json.dump(checkpoint, f, indent=2, default=str)
+    """Save checkpoint to file after each restaurant.
+
+    Written to a temp file and swapped in with os.replace, so a crash
+    mid-write never leaves a truncated checkpoint behind.
+    """
+    tmp_file = CHECKPOINT_FILE.with_suffix(".tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(_dumps(checkpoint))
+    os.replace(tmp_file, CHECKPOINT_FILE)
+
+
+def append_result_log(result: dict):
+    """Append one result to RESULTS_LOG_FILE with a single write."""
+    with open(RESULTS_LOG_FILE, "ab") as f:
+        f.write(_dumps(result) + b"\n")
 
 
 # ==============================================================================
@@ -116,12 +260,48 @@ VIBE_PATTERNS = {
     },
 }
 
+# All categories fused into one alternation with a named group per category,
+# so each review is scanned once; m.lastgroup names the category that matched.
+# Case-insensitivity is an inline (?i) flag: re2 has no re.IGNORECASE constant.
+_VIBE_REGEX = vibe_re.compile(
+    "(?i)" + "|".join(
+        f"(?P<{cat}>{'|'.join(cfg['patterns'])})"
+        for cat, cfg in VIBE_PATTERNS.items()
+    )
+)
+
+
+# ==============================================================================
+# CHAIN FILTER
+# ==============================================================================
+
+# Known chains (fast food and casual chains), matched as lowercase substrings
+CHAINS = (
+    "mcdonald", "starbucks", "chick-fil-a", "taco bell", "wendy", "dunkin",
+    "chipotle", "burger king", "subway", "domino", "panda express", "panera",
+    "popeyes", "pizza hut", "sonic", "raising cane", "dairy queen", "kfc",
+    "little caesars", "jack in the box", "wingstop", "arby", "whataburger",
+    "buffalo wild wings", "culver", "jersey mike", "papa john", "ihop",
+    "jimmy john", "zaxby", "in-n-out", "five guys", "bojangles", "hardee",
+    "dutch bros", "carl's jr", "tropical smoothie", "waffle house", "shake shack",
+    "crumbl", "qdoba", "firehouse subs", "el pollo loco", "freddy", "del taco",
+    "cava", "auntie anne", "tim hortons", "smoothie king", "steak 'n shake",
+    "krispy kreme", "charley", "papa murphy", "scooter", "moe's southwest",
+    "habit burger", "baskin-robbins", "sweetgreen", "einstein bros", "white castle",
+    "dave's hot chicken", "noodles & company", "mod pizza", "cold stone",
+    "potbelly", "jet's pizza", "chuck e cheese", "tgi friday", "california pizza kitchen",
+)
+
+# Single compiled alternation: one scan of the name instead of one per chain
+_CHAIN_REGEX = re.compile("|".join(re.escape(chain) for chain in CHAINS))
+
+
 # ==============================================================================
 # SERPAPI: Get place details using place_id
 # ==============================================================================
 
 
-def get_place_details(place_id: str) -> dict | None:
+def get_place_details(place_id: str, log: list[str]) -> dict | None:
     """
     Get full place details including data_id using place_id.
     This uses the 'place' type search which returns complete info.
@@ -137,11 +317,11 @@ def get_place_details(place_id: str) -> dict | None:
     }
 
     try:
-        response = requests.get(url, params=params, timeout=30)
-        data = response.json()
+        response = serpapi_get(url, params)
+        data = _json(response)
 
         if "error" in data:
-            print(f"      API Error: {data['error']}")
+            log.append(f"      API Error: {data['error']}")
             return None
 
         # The place details are in the 'place_results' key
@@ -159,7 +339,7 @@ def get_place_details(place_id: str) -> dict | None:
         }
 
     except Exception as e:
-        print(f"      Error getting place details: {e}")
+        log.append(f"      Error getting place details: {e}")
         return None
 
 
@@ -180,8 +360,8 @@ def search_restaurants_serpapi(query: str, limit: int = 100) -> list[dict]:
     }
 
     try:
-        response = requests.get(url, params=params, timeout=30)
-        data = response.json()
+        response = serpapi_get(url, params)
+        data = _json(response)
 
         if "error" in data:
             print(f"      ❌ SerpApi error: {data['error']}")
@@ -239,8 +419,6 @@ def get_all_restaurants() -> list[dict]:
         except Exception as e:
             print(f"     ❌ Error: {e}")
 
-        time.sleep(1)  # Be nice to API
-
     restaurants = list(all_restaurants.values())
     print(f"\n✅ Total unique restaurants: {len(restaurants)}")
     
@@ -257,7 +435,7 @@ def get_all_restaurants() -> list[dict]:
 # ==============================================================================
 
 
-def get_vibe_photos_serpapi(data_id: str, limit: int = 10) -> list[dict]:
+def get_vibe_photos_serpapi(data_id: str, log: list[str], limit: int = 10) -> list[dict]:
     """Fetch VIBE-category photos from Google Maps via SerpApi."""
     url = "https://serpapi.com/search.json"
     params = {
@@ -269,11 +447,11 @@ def get_vibe_photos_serpapi(data_id: str, limit: int = 10) -> list[dict]:
     }
 
     try:
-        response = requests.get(url, params=params, timeout=30)
-        data = response.json()
+        response = serpapi_get(url, params)
+        data = _json(response)
 
         if "error" in data:
-            print(f"      ❌ SerpApi error: {data['error']}")
+            log.append(f"      ❌ SerpApi error: {data['error']}")
             return []
 
         photos = []
@@ -286,7 +464,7 @@ def get_vibe_photos_serpapi(data_id: str, limit: int = 10) -> list[dict]:
         return photos
 
     except Exception as e:
-        print(f"      ❌ SerpApi photos error: {e}")
+        log.append(f"      ❌ SerpApi photos error: {e}")
         return []
 
 
@@ -295,7 +473,7 @@ def get_vibe_photos_serpapi(data_id: str, limit: int = 10) -> list[dict]:
 # ==============================================================================
 
 
-def get_reviews_serpapi(data_id: str, limit: int = 5) -> list[dict]:
+def get_reviews_serpapi(data_id: str, log: list[str], limit: int = 5) -> list[dict]:
     """Fetch reviews from Google Maps via SerpApi."""
     url = "https://serpapi.com/search.json"
     params = {
@@ -307,11 +485,11 @@ def get_reviews_serpapi(data_id: str, limit: int = 5) -> list[dict]:
     }
 
     try:
-        response = requests.get(url, params=params, timeout=30)
-        data = response.json()
+        response = serpapi_get(url, params)
+        data = _json(response)
 
         if "error" in data:
-            print(f"      ❌ SerpApi error: {data['error']}")
+            log.append(f"      ❌ SerpApi error: {data['error']}")
             return []
 
         reviews = []
@@ -326,7 +504,7 @@ def get_reviews_serpapi(data_id: str, limit: int = 5) -> list[dict]:
         return reviews
 
     except Exception as e:
-        print(f"      ❌ SerpApi reviews error: {e}")
+        log.append(f"      ❌ SerpApi reviews error: {e}")
         return []
 
 
@@ -337,20 +515,15 @@ def get_reviews_serpapi(data_id: str, limit: int = 5) -> list[dict]:
 
 def analyze_vibes(reviews: list[dict]) -> dict:
     """Analyze reviews for vibe mentions."""
-    compiled = {
-        cat: [re.compile(p, re.IGNORECASE) for p in cfg["patterns"]]
-        for cat, cfg in VIBE_PATTERNS.items()
-    }
-
     counts = defaultdict(int)
 
     for review in reviews:
         text = review.get("review_text", "") or ""
-        for category, patterns in compiled.items():
-            for pattern in patterns:
-                if pattern.search(text):
-                    counts[category] += 1
-                    break
+        # Each category counts at most once per review
+        seen = {m.lastgroup for m in _VIBE_REGEX.finditer(text)}
+        for category in VIBE_PATTERNS:
+            if category in seen:
+                counts[category] += 1
 
     sorted_vibes = sorted(
         [(VIBE_PATTERNS[cat]["display_name"], count) for cat, count in counts.items()],
@@ -361,32 +534,53 @@ def analyze_vibes(reviews: list[dict]) -> dict:
     return {"top_vibes": sorted_vibes[:5], "counts": dict(counts)}
 
 
-def download_photos(photos: list[dict], restaurant_name: str) -> list[str]:
+def _fetch_one(url: str, filepath: Path, log: list[str]) -> bool:
+    """Download a single photo to filepath. Returns True on success."""
+    # Already fetched on an earlier run (the filename embeds a hash of the URL).
+    # Files only appear under their final name once complete, see below.
+    if filepath.exists() and filepath.stat().st_size > 0:
+        return True
+
+    # Download to a .part file and rename it into place on success, so an
+    # interrupted download is retried next run instead of kept as truncated
+    part_path = filepath.with_name(filepath.name + ".part")
+    try:
+        # Pipe the body straight to disk instead of buffering the whole image
+        with SESSION.get(url, stream=True, timeout=15) as response:
+            if response.status_code == 200:
+                response.raw.decode_content = True
+                with open(part_path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=65536)
+                os.replace(part_path, filepath)
+                return True
+    except Exception as e:
+        part_path.unlink(missing_ok=True)
+        log.append(f"      ⚠️ Download failed: {e}")
+    return False
+
+
+def download_photos(photos: list[dict], restaurant_name: str, log: list[str]) -> list[str]:
     """Download photos to local directory."""
     IMAGES_DIR.mkdir(parents=True, exist_ok=True)
 
     safe_name = "".join(c if c.isalnum() or c in " -" else "" for c in restaurant_name)
     safe_name = safe_name.replace(" ", "_")[:30]
 
-    downloaded = []
-
+    filenames = []
+    urls = []
     for i, photo in enumerate(photos[:IMAGES_NEEDED]):
         url = photo.get("url")
-        if not url:
-            continue
+        if url:
+            key = hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+            filenames.append(f"{safe_name}_vibe_{i+1}_{key}.jpg")
+            urls.append(url)
 
-        try:
-            response = requests.get(url, timeout=15)
-            if response.status_code == 200:
-                filename = f"{safe_name}_vibe_{i+1}.jpg"
-                filepath = IMAGES_DIR / filename
-                with open(filepath, "wb") as f:
-                    f.write(response.content)
-                downloaded.append(filename)
-        except Exception as e:
-            print(f"      ⚠️ Download failed: {e}")
+    if not urls:
+        return []
 
-    return downloaded
+    # Photos are independent downloads, so fetch them concurrently
+    ok = DOWNLOAD_POOL.map(_fetch_one, urls, [IMAGES_DIR / f for f in filenames], [log] * len(urls))
+    return [filename for filename, success in zip(filenames, ok, strict=True) if success]
 
 
 # ==============================================================================
@@ -394,14 +588,19 @@ def download_photos(photos: list[dict], restaurant_name: str) -> list[str]:
 # ==============================================================================
 
 
-def process_restaurant(restaurant: dict) -> dict | None:
-    """Process a single restaurant. Returns None if requirements not met."""
+def process_restaurant(restaurant: dict, log: list[str]) -> dict | None:
+    """Process a single restaurant. Returns None if requirements not met.
+
+    Runs in a worker thread, so progress and error messages (including those
+    of the helpers it calls) are appended to `log` for the main thread to
+    print instead of being printed here.
+    """
 
     query = restaurant.get("query") or restaurant.get("name")
 
-    print(f"\n{'='*50}")
-    print(f"🍽️  {query}")
-    print(f"{'='*50}")
+    log.append(f"\n{'='*50}")
+    log.append(f"🍽️  {query}")
+    log.append(f"{'='*50}")
 
     # Quality filter: Minimal filtering - exclude obvious bad data & chains
     rating = restaurant.get("rating", 0)
@@ -409,33 +608,23 @@ def process_restaurant(restaurant: dict) -> dict | None:
 
     # Skip if no rating or no reviews (means no real data)
     if not rating or rating == 0:
-        print(f"  ❌ SKIP: No rating data")
+        log.append("  ❌ SKIP: No rating data")
         return None
 
     if not review_count or review_count < 1:
-        print(f"  ❌ SKIP: No reviews")
+        log.append("  ❌ SKIP: No reviews")
+        return None
+
+    # The listed review count bounds what the reviews endpoint can return, so
+    # reject before spending any API calls on photos or place details
+    if review_count < REVIEWS_NEEDED:
+        log.append(f"  ❌ SKIP: Only {review_count} reviews listed (need {REVIEWS_NEEDED})")
         return None
 
     # Skip known chains (fast food and casual chains)
     name = restaurant.get("name", "").lower()
-    chains = [
-        "mcdonald", "starbucks", "chick-fil-a", "taco bell", "wendy", "dunkin",
-        "chipotle", "burger king", "subway", "domino", "panda express", "panera",
-        "popeyes", "pizza hut", "sonic", "raising cane", "dairy queen", "kfc",
-        "little caesars", "jack in the box", "wingstop", "arby", "whataburger",
-        "buffalo wild wings", "culver", "jersey mike", "papa john", "ihop",
-        "jimmy john", "zaxby", "in-n-out", "five guys", "bojangles", "hardee",
-        "dutch bros", "carl's jr", "tropical smoothie", "waffle house", "shake shack",
-        "crumbl", "qdoba", "firehouse subs", "el pollo loco", "freddy", "del taco",
-        "cava", "auntie anne", "tim hortons", "smoothie king", "steak 'n shake",
-        "krispy kreme", "charley", "papa murphy", "scooter", "moe's southwest",
-        "habit burger", "baskin-robbins", "sweetgreen", "einstein bros", "white castle",
-        "dave's hot chicken", "noodles & company", "mod pizza", "cold stone",
-        "potbelly", "jet's pizza", "chuck e cheese", "tgi friday", "california pizza kitchen"
-    ]
-
-    if any(chain in name for chain in chains):
-        print(f"  ❌ SKIP: Chain restaurant ({restaurant.get('name')})")
+    if _CHAIN_REGEX.search(name):
+        log.append(f"  ❌ SKIP: Chain restaurant ({restaurant.get('name')})")
         return None
 
     data_id = restaurant.get("data_id")
@@ -444,19 +633,18 @@ def process_restaurant(restaurant: dict) -> dict | None:
     if not data_id:
         place_id = restaurant.get("place_id")
         if not place_id:
-            print("  ❌ SKIP: No place_id available")
+            log.append("  ❌ SKIP: No place_id available")
             return None
             
-        print("  🔍 Missing data_id, fetching place details...")
-        place_details = get_place_details(place_id)
-        time.sleep(0.5)  # Small delay after lookup
+        log.append("  🔍 Missing data_id, fetching place details...")
+        place_details = get_place_details(place_id, log)
         
         if not place_details or not place_details.get("data_id"):
-            print("  ❌ SKIP: Could not retrieve data_id from place details")
+            log.append("  ❌ SKIP: Could not retrieve data_id from place details")
             return None
         
         data_id = place_details["data_id"]
-        print(f"  ✅ Got data_id: {data_id}")
+        log.append(f"  ✅ Got data_id: {data_id}")
         
         # Update restaurant record with any new info
         restaurant["data_id"] = data_id
@@ -465,36 +653,36 @@ def process_restaurant(restaurant: dict) -> dict | None:
         if place_details.get("reviews_count"):
             restaurant["reviews_count"] = place_details["reviews_count"]
 
-    print(f"  ✅ Restaurant: {restaurant['name']}")
-    print(f"     Data ID: {data_id}")
+    log.append(f"  ✅ Restaurant: {restaurant['name']}")
+    log.append(f"     Data ID: {data_id}")
 
-    # Step 1: Get vibe photos via SerpApi
-    print("  📷 Fetching vibe photos...")
-    vibe_photos = get_vibe_photos_serpapi(data_id, limit=IMAGES_NEEDED)
+    # Steps 1 & 2: Get vibe photos and reviews via SerpApi (independent, so in parallel)
+    log.append(f"  📷 Fetching vibe photos and {REVIEWS_NEEDED} reviews...")
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        fphotos = ex.submit(get_vibe_photos_serpapi, data_id, log, IMAGES_NEEDED)
+        freviews = ex.submit(get_reviews_serpapi, data_id, log, REVIEWS_NEEDED)
+        vibe_photos = fphotos.result()
+        reviews = freviews.result()
 
     if len(vibe_photos) < IMAGES_NEEDED:
-        print(f"  ❌ SKIP: Only {len(vibe_photos)} vibe photos (need {IMAGES_NEEDED})")
+        log.append(f"  ❌ SKIP: Only {len(vibe_photos)} vibe photos (need {IMAGES_NEEDED})")
         return None
 
-    print(f"  ✅ Got {len(vibe_photos)} vibe photos")
-
-    # Step 2: Get reviews via SerpApi
-    print(f"  📝 Fetching {REVIEWS_NEEDED} reviews...")
-    reviews = get_reviews_serpapi(data_id, REVIEWS_NEEDED)
+    log.append(f"  ✅ Got {len(vibe_photos)} vibe photos")
 
     if len(reviews) < REVIEWS_NEEDED:
-        print(f"  ❌ SKIP: Only {len(reviews)} reviews (need {REVIEWS_NEEDED})")
+        log.append(f"  ❌ SKIP: Only {len(reviews)} reviews (need {REVIEWS_NEEDED})")
         return None
 
-    print(f"  ✅ Got {len(reviews)} reviews")
+    log.append(f"  ✅ Got {len(reviews)} reviews")
 
     # Step 3: Analyze vibes
     vibe_analysis = analyze_vibes(reviews)
 
     # Step 4: Download photos
-    print("  💾 Downloading photos...")
-    downloaded = download_photos(vibe_photos, restaurant["name"])
-    print(f"  ✅ Downloaded {len(downloaded)} photos")
+    log.append("  💾 Downloading photos...")
+    downloaded = download_photos(vibe_photos, restaurant["name"], log)
+    log.append(f"  ✅ Downloaded {len(downloaded)} photos")
 
     return {
         "info": {
@@ -577,75 +765,77 @@ def main():
     # -------------------------------------------------------------------------
     # Step 3: Process each restaurant
     # -------------------------------------------------------------------------
-    serpapi_calls = 0
     api_errors_in_a_row = 0
     MAX_CONSECUTIVE_ERRORS = 5  # Stop if we hit 5 API errors in a row
 
-    for i, restaurant in enumerate(remaining):
-        query = restaurant.get("query") or restaurant.get("name")
-
-        # Check for too many consecutive errors (likely API limit hit)
-        if api_errors_in_a_row >= MAX_CONSECUTIVE_ERRORS:
-            print(f"\n⚠️  Hit {MAX_CONSECUTIVE_ERRORS} API errors in a row.")
-            print("    Likely hit API limit. Update your API key and re-run!")
-            break
-
-        try:
-            had_data_id = bool(restaurant.get("data_id"))
-            result = process_restaurant(restaurant)
-            
-            # Count API calls (3 if we had to fetch place details, 2 otherwise)
-            if not had_data_id:
-                serpapi_calls += 3
-            else:
-                serpapi_calls += 2
-                
-            api_errors_in_a_row = 0  # Reset on success
-
-            # Update checkpoint
-            checkpoint["processed"].append(query)
-            if result:
-                checkpoint["results"].append(result)
-            else:
+    # Workers fetch restaurants in parallel; results are consumed in order on
+    # this thread, so checkpoint updates never race
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        logs = [[] for _ in remaining]
+        futures = [pool.submit(process_restaurant, r, log) for r, log in zip(remaining, logs, strict=True)]
+
+        for i, (restaurant, future, log) in enumerate(zip(remaining, futures, logs, strict=True)):
+            query = restaurant.get("query") or restaurant.get("name")
+
+            # Check for too many consecutive errors (likely API limit hit)
+            if api_errors_in_a_row >= MAX_CONSECUTIVE_ERRORS:
+                print(f"\n⚠️  Hit {MAX_CONSECUTIVE_ERRORS} API errors in a row.")
+                print("    Likely hit API limit. Update your API key and re-run!")
+                for pending in futures[i:]:
+                    pending.cancel()
+                break
+
+            try:
+                # Print the worker's messages in one block once it has finished
+                wait([future])
+                print("\n".join(log))
+                result = future.result()
+                api_errors_in_a_row = 0  # Reset on success
+
+                # Update checkpoint
+                checkpoint["processed"].append(query)
+                if result:
+                    checkpoint["results"].append(result)
+                    append_result_log(result)
+                else:
+                    checkpoint["skipped"].append(query)
+
+                save_checkpoint(checkpoint)
+
+                progress = len(checkpoint["processed"])
+                total = len(all_restaurants)
+                success = len(checkpoint["results"])
+                print(f"    💾 Checkpoint saved ({progress}/{total}) | ✅ {success} successful | 🔍 {SERPAPI_LIMITER.acquired} API calls")
+
+            except KeyboardInterrupt:
+                print("\n\n⚠️  Interrupted by user. Progress saved!")
+                for pending in futures[i:]:
+                    pending.cancel()
+                break
+            except Exception as e:
+                error_msg = str(e).lower()
+                if "api" in error_msg or "limit" in error_msg or "quota" in error_msg or "unauthorized" in error_msg:
+                    api_errors_in_a_row += 1
+                    print(f"    ⚠️  API error ({api_errors_in_a_row}/{MAX_CONSECUTIVE_ERRORS}): {e}")
+                else:
+                    print(f"    ❌ Unexpected error: {e}")
+
+                # Still save to checkpoint even on error
+                checkpoint["processed"].append(query)
                 checkpoint["skipped"].append(query)
-
-            save_checkpoint(checkpoint)
-
-            progress = len(checkpoint["processed"])
-            total = len(all_restaurants)
-            success = len(checkpoint["results"])
-            print(f"    💾 Checkpoint saved ({progress}/{total}) | ✅ {success} successful | 🔍 {serpapi_calls} API calls")
-
-            # Small delay to be nice to API
-            time.sleep(0.5)
-
-        except KeyboardInterrupt:
-            print("\n\n⚠️  Interrupted by user. Progress saved!")
-            break
-        except Exception as e:
-            error_msg = str(e).lower()
-            if "api" in error_msg or "limit" in error_msg or "quota" in error_msg or "unauthorized" in error_msg:
-                api_errors_in_a_row += 1
-                print(f"    ⚠️  API error ({api_errors_in_a_row}/{MAX_CONSECUTIVE_ERRORS}): {e}")
-            else:
-                print(f"    ❌ Unexpected error: {e}")
-            
-            # Still save to checkpoint even on error
-            checkpoint["processed"].append(query)
-            checkpoint["skipped"].append(query)
-            save_checkpoint(checkpoint)
+                save_checkpoint(checkpoint)
 
     # -------------------------------------------------------------------------
     # Step 4: Save final results and show summary
     # -------------------------------------------------------------------------
     output_file = VIBECHECK_RESULTS_FILE
-    with open(output_file, "w") as f:
-        json.dump(checkpoint["results"], f, indent=2, default=str)
+    with open(output_file, "wb") as f:
+        f.write(_dumps(checkpoint["results"], indent=True))
 
     print(f"\n{'='*60}")
     print("📊 FINAL SUMMARY")
     print(f"{'='*60}")
-    print(f"📍 SerpApi calls this session: {serpapi_calls}")
+    print(f"📍 SerpApi calls this session: {SERPAPI_LIMITER.acquired}")
     print(f"✅ Total successful: {len(checkpoint['results'])}/{len(all_restaurants)}")
     print(f"❌ Total skipped: {len(checkpoint['skipped'])}")
     print(f"⏳ Remaining: {len(all_restaurants) - len(checkpoint['processed'])}")
@@ -3,21 +3,77 @@ Sync database filenames to match the actual files in images_corect_order.
 This updates the database to match the AI-classified and reordered files.
 NO DELETIONS - only updates filenames in database.
 """
+import os
 import sqlite3
 from pathlib import Path
 from collections import defaultdict
+from tqdm import tqdm
 
 DB_PATH = Path(__file__).parent.parent / "vibecheck_full_output" / "vibecheck.db"
 IMAGE_DIR = Path(__file__).parent.parent / "vibecheck_full_output" / "images_corect_order"
 
+# Punctuation dropped from names before comparison, removed in a single pass
+_NORMALIZE_TABLE = str.maketrans("", "", "'&,-.|")
+
 def normalize_name(name):
     """Normalize restaurant name to match filename pattern."""
-    normalized = name.upper()
-    normalized = normalized.replace("'", "").replace("&", "").replace(",", "")
-    normalized = normalized.replace("-", "").replace(".", "").replace("|", "")
+    normalized = name.upper().translate(_NORMALIZE_TABLE)
     normalized = normalized.replace("  ", " ").replace(" ", "_")
-    normalized = normalized.strip("_")
-    return normalized
+    return normalized.strip("_")
+
+# Minimum length ratio for a substring name match
+MATCH_THRESHOLD = 0.7
+
+def trigrams(text):
+    """Set of all 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def build_name_index(names):
+    """Index names for substring lookups: name -> position, trigram -> positions."""
+    positions = {name: i for i, name in enumerate(names)}
+    postings = defaultdict(set)
+    for i, name in enumerate(names):
+        for gram in trigrams(name):
+            postings[gram].add(i)
+    return names, positions, postings
+
+def substring_candidates(text, name_index):
+    """Positions (in order) of names that may contain, or be contained in, text
+    with a length ratio above MATCH_THRESHOLD. May include extra candidates."""
+    names, positions, postings = name_index
+    found = set()
+
+    # Names inside text are long enough that only a few slices need checking
+    for size in range(max(1, int(len(text) * MATCH_THRESHOLD)), len(text) + 1):
+        for start in range(len(text) - size + 1):
+            i = positions.get(text[start:start + size])
+            if i is not None:
+                found.add(i)
+
+    # Names containing text must contain every trigram of text
+    grams = trigrams(text)
+    if grams:
+        lists = sorted((postings.get(gram, set()) for gram in grams), key=len)
+        found.update(lists[0].intersection(*lists[1:]))
+    else:
+        found.update(i for i, name in enumerate(names) if text in name)
+
+    return sorted(found)
+
+def fuzzy_match(text, name_index):
+    """Closest indexed name that contains, or is contained in, text with a
+    length ratio above MATCH_THRESHOLD, or None."""
+    names = name_index[0]
+    best_match = None
+    best_score = 0
+    for i in substring_candidates(text, name_index):
+        name = names[i]
+        if text in name or name in text:
+            score = min(len(text), len(name)) / max(len(text), len(name))
+            if score > best_score and score > MATCH_THRESHOLD:
+                best_score = score
+                best_match = name
+    return best_match
 
 def extract_place_id_from_filename(filename):
     """Extract Google Place ID from ChIJ filename."""
@@ -28,6 +84,12 @@ def extract_place_id_from_filename(filename):
 
 def sync_database():
     conn = sqlite3.connect(DB_PATH)
+    # Bulk-update settings: WAL with relaxed syncs, in-memory temp storage
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+    """)
     cursor = conn.cursor()
 
     print("=" * 80)
@@ -48,16 +110,18 @@ def sync_database():
         name_to_resto[normalized] = (resto_id, name, place_id)
         place_id_to_resto[place_id] = (resto_id, name, place_id)
 
-    # Get all files in the directory
-    all_files = list(IMAGE_DIR.glob("*.jpg"))
+    name_index = build_name_index(list(name_to_resto))
+
+    # Get all files in the directory, skipping macOS "._*" metadata dotfiles
+    # (Path.glob used to include them)
+    with os.scandir(IMAGE_DIR) as entries:
+        all_files = [e.name for e in entries if e.name.endswith(".jpg") and not e.name.startswith(".") and e.is_file()]
     print(f"Found {len(all_files)} files in images_corect_order")
 
     # Group files by restaurant
     files_by_restaurant = defaultdict(list)
 
-    for file_path in all_files:
-        filename = file_path.name
-
+    for filename in all_files:
         # Match to restaurant
         if filename.startswith('ChIJ'):
             # ChIJ photo - match by Place ID
@@ -68,33 +132,25 @@ def sync_database():
         elif '_vibe_' in filename:
             # Vibe photo - match by restaurant name
             resto_part = filename.split('_vibe_')[0].upper()
-            # Find best match
-            best_match = None
-            best_score = 0
-            for norm_name, (rid, rname, rpid) in name_to_resto.items():
-                if resto_part == norm_name:
-                    best_match = (rid, rname)
-                    break
-                elif resto_part in norm_name or norm_name in resto_part:
-                    score = min(len(resto_part), len(norm_name)) / max(len(resto_part), len(norm_name))
-                    if score > best_score and score > 0.7:
-                        best_score = score
-                        best_match = (rid, rname)
+            # Exact name first; only fall back to similarity matching on a miss
+            if resto_part in name_to_resto:
+                best_match = resto_part
+            else:
+                best_match = fuzzy_match(resto_part, name_index)
 
             if best_match:
-                files_by_restaurant[best_match[0]].append(filename)
+                files_by_restaurant[name_to_resto[best_match][0]].append(filename)
 
     print(f"\nMatched files to {len(files_by_restaurant)} restaurants")
 
     # Now update database
     updates = []
-    current_photos_map = {}  # (restaurant_id, order) -> photo_id
 
-    # Get current database state
+    # Get current database state in one scan, grouped by restaurant
+    photos_by_resto = defaultdict(list)  # restaurant_id -> [(photo_id, filename)] ordered by id
     cursor.execute("SELECT id, restaurant_id, local_filename FROM vibe_photos ORDER BY id")
     for photo_id, resto_id, filename in cursor.fetchall():
-        if (resto_id, filename) not in current_photos_map:
-            current_photos_map[(resto_id, filename)] = photo_id
+        photos_by_resto[resto_id].append((photo_id, filename))
 
     # For each restaurant, map new files
     total_updated = 0
@@ -103,15 +159,8 @@ def sync_database():
     for resto_id in sorted(files_by_restaurant.keys()):
         files = sorted(files_by_restaurant[resto_id])
 
-        # Get current photos for this restaurant from database
-        cursor.execute("""
-            SELECT id, local_filename
-            FROM vibe_photos
-            WHERE restaurant_id = ?
-            ORDER BY id
-        """, (resto_id,))
-
-        current_photos = cursor.fetchall()
+        # Current photos for this restaurant
+        current_photos = photos_by_resto[resto_id]
 
         if len(files) != len(current_photos):
             print(f"  Warning: Restaurant {resto_id} has {len(current_photos)} in DB but {len(files)} files")
@@ -132,18 +181,16 @@ def sync_database():
     print(f"Total filename updates: {total_updated}")
     print(f"Photos skipped: {total_skipped}")
 
-    # Apply updates
-    for i, (new_filename, photo_id) in enumerate(updates, 1):
-        cursor.execute("""
-            UPDATE vibe_photos
-            SET local_filename = ?
-            WHERE id = ?
-        """, (new_filename, photo_id))
-
-        if i % 1000 == 0:
-            print(f"  Updated {i}/{total_updated}...")
-
+    # Apply updates: one prepared UPDATE reused for every row, in a single transaction
+    cursor.execute("BEGIN IMMEDIATE")
+    cursor.executemany("""
+        UPDATE vibe_photos
+        SET local_filename = ?
+        WHERE id = ?
+    """, tqdm(updates, desc="Updating filenames", miniters=max(1, len(updates) // 200), mininterval=0.5))
     conn.commit()
+
+    conn.execute("PRAGMA journal_mode=DELETE")
     conn.close()
 
     print(f"\n✅ Database sync complete!")
@@ -1,38 +1,18 @@
 """
 Uncompress images_compressed from 70% to 100% quality.
 Overwrites the existing images_compressed folder.
+
+Re-encoding at 100% does not bring back detail lost at 70%; it only makes the
+files larger. Skip this step unless something downstream needs 100% files.
 """
 from pathlib import Path
-from PIL import Image
-from tqdm import tqdm
+from _image_pipeline import run_pipeline
 
 COMPRESSED_DIR = Path(__file__).parent.parent / "vibecheck_full_output" / "images_compressed"
 
 def uncompress_images():
     """Uncompress all images from 70% to 100% quality."""
-    image_files = list(COMPRESSED_DIR.glob("*.jpg"))
-    print(f"Found {len(image_files)} images to uncompress")
-    print(f"Converting from 70% to 100% quality...")
-
-    success_count = 0
-    error_count = 0
-
-    for image_path in tqdm(image_files, desc="Uncompressing"):
-        try:
-            # Open image
-            img = Image.open(image_path)
-
-            # Save at 100% quality (overwrite original)
-            img.save(image_path, 'JPEG', quality=100, optimize=False)
-            success_count += 1
-
-        except Exception as e:
-            print(f"\nError processing {image_path.name}: {e}")
-            error_count += 1
-
-    print(f"\n✅ Uncompression complete!")
-    print(f"   Success: {success_count} images")
-    print(f"   Errors: {error_count} images")
+    run_pipeline(COMPRESSED_DIR, reencode=True, dst=COMPRESSED_DIR)
 
 if __name__ == "__main__":
     uncompress_images()
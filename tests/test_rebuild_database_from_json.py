@@ -0,0 +1,54 @@
+"""Tests for reading the results JSON during the database rebuild."""
+import json
+
+import pytest
+import rebuild_database_from_json as rebuild
+
+RESTAURANTS = [
+    {
+        "info": {"name": "Café Sabarsky", "place_id": "p1", "rating": 4.6, "reviews_count": 1200},
+        "reviews": [{"text": "Cozy, dim and quiet", "likes": 3}],
+        "vibe_analysis": {"top_vibes": [["Cozy/Intimate", 2]]},
+    },
+    {
+        "info": {"name": "Ramen 一風堂", "place_id": "p2", "rating": 4.0, "reviews_count": None},
+        "reviews": [],
+        "downloaded_files": ["p2_1.jpg"],
+    },
+]
+
+
+@pytest.fixture(params=["ijson", "json"])
+def parser(request, monkeypatch):
+    """Run each test with the ijson streaming parser and the json fallback."""
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(rebuild, "ijson", None)
+    return request.param
+
+
+class TestIterRestaurants:
+    """Test streaming restaurants out of the results file."""
+
+    def test_matches_json_load(self, tmp_path, parser):
+        """Test that every entry comes back equal to json.load's."""
+        results_file = tmp_path / "vibecheck_results.json"
+        results_file.write_text(json.dumps(RESTAURANTS, indent=2, ensure_ascii=False))
+
+        with open(results_file, "rb") as f:
+            restaurants = list(rebuild.iter_restaurants(f))
+
+        assert restaurants == RESTAURANTS
+        assert isinstance(restaurants[0]["info"]["rating"], float)
+
+    def test_appended_compact_file(self, tmp_path, parser):
+        """Test the compact one-entry-per-line layout append_results writes."""
+        results_file = tmp_path / "vibecheck_results.json"
+        lines = ",\n".join(
+            json.dumps(r, separators=(",", ":"), ensure_ascii=False) for r in RESTAURANTS
+        )
+        results_file.write_text("[\n" + lines + "\n]")
+
+        with open(results_file, "rb") as f:
+            assert list(rebuild.iter_restaurants(f)) == RESTAURANTS
@@ -0,0 +1,161 @@
+"""Tests for the scrapers' shared results/checkpoint file helpers."""
+import json
+import os
+
+import pytest
+from _scraper_io import append_results, flush_checkpoint
+
+ENTRY_A = {"info": {"name": "Café Sabarsky", "place_id": "p1"}, "reviews": []}
+ENTRY_B = {"info": {"name": "Ramen 一風堂", "place_id": "p2"}, "reviews": [{"text": "🍜"}]}
+
+
+class TestAppendResults:
+    """Test appending entries to the results JSON array in place."""
+
+    def test_creates_missing_file(self, tmp_path):
+        """Test that a missing results file is created as a new array."""
+        results_file = tmp_path / "results.json"
+        append_results(results_file, [ENTRY_A])
+
+        assert json.loads(results_file.read_bytes()) == [ENTRY_A]
+
+    def test_no_entries_leaves_file_untouched(self, tmp_path):
+        """Test that appending nothing doesn't create or modify the file."""
+        results_file = tmp_path / "results.json"
+        append_results(results_file, [])
+        assert not results_file.exists()
+
+        results_file.write_text("[]")
+        append_results(results_file, [])
+        assert results_file.read_text() == "[]"
+
+    def test_empty_array(self, tmp_path):
+        """Test appending to an existing empty array."""
+        results_file = tmp_path / "results.json"
+        results_file.write_text("[]")
+        append_results(results_file, [ENTRY_A, ENTRY_B])
+
+        assert json.loads(results_file.read_bytes()) == [ENTRY_A, ENTRY_B]
+
+    def test_legacy_indented_file(self, tmp_path):
+        """Test appending to a file written by json.dump(..., indent=2)."""
+        results_file = tmp_path / "results.json"
+        results_file.write_text(json.dumps([ENTRY_A], indent=2))
+        append_results(results_file, [ENTRY_B])
+
+        assert json.loads(results_file.read_bytes()) == [ENTRY_A, ENTRY_B]
+
+    def test_trailing_newline(self, tmp_path):
+        """Test that whitespace after the closing bracket is handled."""
+        results_file = tmp_path / "results.json"
+        results_file.write_text(json.dumps([ENTRY_A], indent=2) + "\n")
+        append_results(results_file, [ENTRY_B])
+
+        assert json.loads(results_file.read_bytes()) == [ENTRY_A, ENTRY_B]
+
+    def test_empty_array_with_trailing_newline(self, tmp_path):
+        """Test appending to an empty array followed by a newline."""
+        results_file = tmp_path / "results.json"
+        results_file.write_text("[\n]\n")
+        append_results(results_file, [ENTRY_A])
+
+        assert json.loads(results_file.read_bytes()) == [ENTRY_A]
+
+    def test_non_ascii_written_as_utf8(self, tmp_path):
+        """Test that non-ASCII text is stored as UTF-8, not \\u escapes."""
+        results_file = tmp_path / "results.json"
+        append_results(results_file, [ENTRY_A])
+        append_results(results_file, [ENTRY_B])
+
+        raw = results_file.read_bytes()
+        assert "Café".encode() in raw
+        assert "一風堂".encode() in raw
+        assert b"\\u" not in raw
+        assert json.loads(raw.decode("utf-8")) == [ENTRY_A, ENTRY_B]
+
+    def test_repeated_appends(self, tmp_path):
+        """Test that many small appends keep the file a valid array."""
+        results_file = tmp_path / "results.json"
+        entries = [{"info": {"place_id": f"p{i}"}} for i in range(20)]
+        for entry in entries:
+            append_results(results_file, [entry])
+
+        assert json.loads(results_file.read_bytes()) == entries
+
+    @pytest.mark.parametrize("contents", [
+        "   \n\n",
+        '{"info": {"place_id": "p1"}}',
+        "[\n",
+    ])
+    def test_rejects_file_without_closing_bracket(self, tmp_path, contents):
+        """Test that a file not ending in ']' raises and is left unchanged."""
+        results_file = tmp_path / "results.json"
+        results_file.write_text(contents)
+
+        with pytest.raises(ValueError):
+            append_results(results_file, [ENTRY_A])
+        assert results_file.read_text() == contents
+
+    def test_rejects_file_cut_after_last_entry(self, tmp_path):
+        """Test that a file that lost its final ']' isn't spliced into a
+        nested array (the last entry's reviews) instead."""
+        results_file = tmp_path / "results.json"
+        append_results(results_file, [ENTRY_A, ENTRY_B])
+        cut = results_file.read_bytes().rstrip()[:-1].rstrip()
+        results_file.write_bytes(cut)
+
+        with pytest.raises(ValueError):
+            append_results(results_file, [ENTRY_A])
+        assert results_file.read_bytes() == cut
+
+    def test_interrupted_write_leaves_file_intact(self, tmp_path, monkeypatch):
+        """Test that a write cut short restores the original closing bracket."""
+        results_file = tmp_path / "results.json"
+        results_file.write_text(json.dumps([ENTRY_A], indent=2) + "\n")
+        real_pwrite = os.pwrite
+        calls = []
+
+        def short_pwrite(fd, data, offset):
+            calls.append(data)
+            if len(calls) == 1:
+                return real_pwrite(fd, data[:len(data) // 2], offset)
+            return real_pwrite(fd, data, offset)
+
+        monkeypatch.setattr(os, "pwrite", short_pwrite)
+        with pytest.raises(OSError):
+            append_results(results_file, [ENTRY_B])
+        monkeypatch.undo()
+
+        assert json.loads(results_file.read_bytes()) == [ENTRY_A]
+        append_results(results_file, [ENTRY_B])
+        assert json.loads(results_file.read_bytes()) == [ENTRY_A, ENTRY_B]
+
+    def test_trailing_whitespace_longer_than_new_tail(self, tmp_path):
+        """Test that leftover whitespace past the new tail is trimmed."""
+        results_file = tmp_path / "results.json"
+        results_file.write_text("[]" + " " * 4096)
+        append_results(results_file, [{"a": 1}])
+
+        assert json.loads(results_file.read_bytes()) == [{"a": 1}]
+        assert results_file.read_bytes().endswith(b"]")
+
+
+class TestFlushCheckpoint:
+    """Test flushing buffered place_ids to the checkpoint file."""
+
+    def test_writes_and_clears_pending(self, tmp_path):
+        """Test that pending ids are written and the buffer is emptied."""
+        checkpoint = tmp_path / "checkpoint.txt"
+        fd = os.open(checkpoint, os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+        try:
+            pending = bytearray(b"p1\np2\n")
+            flush_checkpoint(fd, pending)
+            assert pending == b""
+
+            flush_checkpoint(fd, pending)
+            pending += b"p3\n"
+            flush_checkpoint(fd, pending)
+        finally:
+            os.close(fd)
+
+        assert checkpoint.read_text().splitlines() == ["p1", "p2", "p3"]
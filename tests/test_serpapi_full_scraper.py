@@ -0,0 +1,205 @@
+"""Tests for the SerpAPI scraper's filters, vibe matching, caching and worker output."""
+import importlib
+import json
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+import pytest
+
+# Names from Google Maps listings; every one contains a known chain string
+CHAIN_NAMES = [
+    "Charleys Philly Steaks",
+    "McDonalds",
+    "McDonald's",
+    "Times Square McDonald's",
+    "Wendys",
+    "Dominos Pizza",
+    "Arbys",
+    "The Habit Burger Grill",
+    "Starbucks Reserve Roastery",
+    "Supersonic Cafe",
+]
+
+INDEPENDENT_NAMES = [
+    "Katz's Delicatessen",
+    "Joe's Pizza",
+    "Le Bernardin",
+    "Xi'an Famous Foods",
+    "",
+]
+
+
+@pytest.fixture(scope="module")
+def scraper(tmp_path_factory):
+    """serpapi_full_scraper imported with its output paths under a temp dir."""
+    pytest.importorskip("torch")  # config.py picks the torch device on import
+    pytest.importorskip("requests")
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    import config
+
+    out = tmp_path_factory.mktemp("scraper_output")
+    config.SCRAPER_OUTPUT_DIR = out
+    config.SCRAPER_IMAGES_DIR = out / "images"
+    config.CHECKPOINT_FILE = out / "checkpoint.json"
+    config.RESTAURANTS_FILE = out / "all_restaurants.json"
+    config.VIBECHECK_RESULTS_FILE = out / "vibecheck_results.json"
+    return importlib.import_module("serpapi_full_scraper")
+
+
+@pytest.fixture
+def serpapi_server():
+    """Local HTTP server standing in for SerpAPI; yields (url, request paths)."""
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            body = json.dumps({"search_metadata": {"status": "Success"}}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/search.json", hits
+    server.shutdown()
+    server.server_close()
+
+
+def substring_scan(name, chains):
+    """The original chain check: any chain string anywhere in the name."""
+    return any(chain in name for chain in chains)
+
+
+class TestChainFilter:
+    """Test that the chain filter matches the original substring check."""
+
+    @pytest.mark.parametrize("name", CHAIN_NAMES + INDEPENDENT_NAMES)
+    def test_regex_matches_substring_scan(self, scraper, name):
+        """Test the compiled regex against the any(chain in name) scan."""
+        lowered = name.lower()
+        assert bool(scraper._CHAIN_REGEX.search(lowered)) == substring_scan(
+            lowered, scraper.CHAINS
+        )
+
+    @pytest.mark.parametrize("name", CHAIN_NAMES)
+    def test_chains_skipped_before_api_calls(self, scraper, monkeypatch, name):
+        """Test that chain restaurants are rejected without any SerpAPI call."""
+        def no_api(*args, **kwargs):
+            raise AssertionError("chain restaurant reached the API")
+
+        monkeypatch.setattr(scraper, "serpapi_get", no_api)
+        restaurant = {"name": name, "rating": 4.0, "reviews_count": 500}
+        log = []
+
+        assert scraper.process_restaurant(restaurant, log) is None
+        assert any("Chain restaurant" in line for line in log)
+
+REVIEWS = [
+    "ROMANTIC date night, cozy and dim. Outdoor PATIO!",
+    "Loud and lively, great for groups",
+    "Candlelit, moody, perfect for an anniversary",
+    "The dimsum was fine",
+    "",
+    "Rooftop terrace with a chill vibe; quiet on weekdays",
+]
+
+
+class TestAnalyzeVibes:
+    """Test the fused vibe regex against per-pattern matching."""
+
+    def test_counts_match_per_pattern_search(self, scraper):
+        """Test analyze_vibes against searching each pattern separately."""
+        expected = {}
+        for text in REVIEWS:
+            for cat, cfg in scraper.VIBE_PATTERNS.items():
+                if any(re.search(p, text, re.IGNORECASE) for p in cfg["patterns"]):
+                    expected[cat] = expected.get(cat, 0) + 1
+
+        result = scraper.analyze_vibes([{"review_text": t} for t in REVIEWS])
+        assert result["counts"] == expected
+
+    def test_re2_matches_stdlib(self, scraper):
+        """Test that google-re2 finds the same categories as the stdlib re."""
+        re2 = pytest.importorskip("re2")
+        pattern = scraper._VIBE_REGEX.pattern
+        for text in REVIEWS:
+            assert {m.lastgroup for m in re2.compile(pattern).finditer(text)} == {
+                m.lastgroup for m in re.compile(pattern).finditer(text)
+            }
+
+
+class TestWorkerOutput:
+    """Test that worker messages are buffered per restaurant."""
+
+    def test_helper_errors_go_to_log(self, scraper, monkeypatch, capsys):
+        """Test that SerpAPI errors in helpers land in the restaurant's log,
+        not on stdout from the worker thread."""
+        def failing_get(url, params):
+            raise RuntimeError(f"quota exceeded ({params['engine']})")
+
+        monkeypatch.setattr(scraper, "serpapi_get", failing_get)
+        restaurant = {"name": "Le Bernardin", "place_id": "p1", "rating": 4.8, "reviews_count": 500}
+        log = []
+
+        assert scraper.process_restaurant(restaurant, log) is None
+        assert capsys.readouterr().out == ""
+        assert any("Error getting place details" in line for line in log)
+
+        restaurant["data_id"] = "d1"
+        log = []
+        assert scraper.process_restaurant(restaurant, log) is None
+        assert capsys.readouterr().out == ""
+        assert any("photos error" in line for line in log)
+        assert any("reviews error" in line for line in log)
+
+
+class TestSerpapiGet:
+    """Test that only requests reaching SerpAPI are throttled and counted."""
+
+    def test_cache_miss_then_hit(self, scraper, serpapi_server, monkeypatch):
+        """Test that a miss takes a token and a repeat is served from cache."""
+        requests_cache = pytest.importorskip("requests_cache")
+        url, hits = serpapi_server
+        monkeypatch.setattr(scraper, "SESSION", requests_cache.CachedSession(
+            backend="memory", ignored_parameters=["api_key"],
+        ))
+        monkeypatch.setattr(scraper, "SERPAPI_LIMITER", scraper.TokenBucket(1000))
+
+        first = scraper.serpapi_get(url, {"q": "cafe", "api_key": "k1"})
+        assert first.status_code == 200 and not first.from_cache
+        assert len(hits) == 1
+        assert scraper.SERPAPI_LIMITER.acquired == 1
+
+        # Same query under another key: the api_key isn't part of the cache key
+        second = scraper.serpapi_get(url, {"q": "cafe", "api_key": "k2"})
+        assert second.status_code == 200 and second.from_cache
+        assert second.json() == first.json()
+        assert len(hits) == 1
+        assert scraper.SERPAPI_LIMITER.acquired == 1
+
+        scraper.serpapi_get(url, {"q": "bar", "api_key": "k1"})
+        assert len(hits) == 2
+        assert scraper.SERPAPI_LIMITER.acquired == 2
+
+    def test_without_requests_cache(self, scraper, serpapi_server, monkeypatch):
+        """Test that every call is sent and counted with a plain Session."""
+        import requests
+
+        url, hits = serpapi_server
+        monkeypatch.setattr(scraper, "CachedSession", None)
+        monkeypatch.setattr(scraper, "SESSION", requests.Session())
+        monkeypatch.setattr(scraper, "SERPAPI_LIMITER", scraper.TokenBucket(1000))
+
+        for _ in range(3):
+            assert scraper.serpapi_get(url, {"q": "cafe"}).status_code == 200
+        assert len(hits) == 3
+        assert scraper.SERPAPI_LIMITER.acquired == 3
@@ -0,0 +1,79 @@
+"""Tests for the vibe-photo name matching in sync_database_to_files."""
+import random
+
+import pytest
+
+pytest.importorskip("tqdm")
+
+from sync_database_to_files import (  # noqa: E402
+    MATCH_THRESHOLD,
+    build_name_index,
+    fuzzy_match,
+    substring_candidates,
+)
+
+
+def full_scan_match(text, names):
+    """Reference implementation: check text against every name in order."""
+    best_match = None
+    best_score = 0
+    for name in names:
+        if text in name or name in text:
+            score = min(len(text), len(name)) / max(len(text), len(name))
+            if score > best_score and score > MATCH_THRESHOLD:
+                best_score = score
+                best_match = name
+    return best_match
+
+
+def random_name(rng, alphabet="AB_C", min_len=1, max_len=12):
+    """Random name over a small alphabet so substring overlaps are common."""
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(min_len, max_len)))
+
+
+class TestFuzzyMatch:
+    """Test that the indexed lookup gives the same answer as a full scan."""
+
+    def test_exact_and_substring_matches(self):
+        """Test simple matches in both directions and a clear miss."""
+        names = ["JOES_PIZZA", "JOES_PIZZA_BAR", "THE_SMITH"]
+        index = build_name_index(names)
+
+        assert fuzzy_match("JOES_PIZZA", index) == "JOES_PIZZA"
+        assert fuzzy_match("JOES_PIZZA_BA", index) == "JOES_PIZZA_BAR"
+        assert fuzzy_match("THE_SMITH_NY", index) == "THE_SMITH"
+        assert fuzzy_match("SMITH", index) is None
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_full_scan(self, seed):
+        """Fuzz: fuzzy_match returns the full-scan result for random names."""
+        rng = random.Random(seed)
+        names = list(dict.fromkeys(random_name(rng) for _ in range(200)))
+        index = build_name_index(names)
+
+        for _ in range(200):
+            if rng.random() < 0.5:
+                # Slices and extensions of real names exercise both directions
+                name = rng.choice(names)
+                start = rng.randint(0, len(name) - 1)
+                text = name[start:rng.randint(start + 1, len(name))]
+                text = random_name(rng, min_len=0, max_len=3) + text
+            else:
+                text = random_name(rng)
+            assert fuzzy_match(text, index) == full_scan_match(text, names)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_candidates_cover_all_substring_matches(self, seed):
+        """Fuzz: every name passing the threshold is among the candidates."""
+        rng = random.Random(seed)
+        names = list(dict.fromkeys(random_name(rng) for _ in range(200)))
+        index = build_name_index(names)
+
+        for _ in range(200):
+            text = random_name(rng)
+            candidates = set(substring_candidates(text, index))
+            for i, name in enumerate(names):
+                if text in name or name in text:
+                    score = min(len(text), len(name)) / max(len(text), len(name))
+                    if score > MATCH_THRESHOLD:
+                        assert i in candidates